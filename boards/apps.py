@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class BoardsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'boards'
+
+    def ready(self):
+        #게시글 목록 캐시 무효화, 작성자 닉네임 동기화 signal 등록
+        from boards import cache, signals
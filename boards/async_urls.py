@@ -0,0 +1,10 @@
+from django.urls import path
+
+from boards.async_views import AsyncBoardListView, AsyncBoardPostingView, AsyncBoardSearchView, AsyncBoardView
+
+urlpatterns = [
+    path("/write", AsyncBoardPostingView.as_view()),
+    path("/search", AsyncBoardSearchView.as_view()),
+    path("", AsyncBoardListView.as_view()),
+    path("/<int:board_id>", AsyncBoardView.as_view())
+]
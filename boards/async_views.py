@@ -0,0 +1,194 @@
+import asyncio, json
+
+from asgiref.sync import sync_to_async
+
+from django.db    import IntegrityError
+from django.http  import HttpResponse
+from django.views import View
+
+from boards.conditional import BoardETag, HasConditionalHeaders, IfMatchTimes, NotModified, SetValidators
+from boards.models      import Board
+from boards.search      import SearchBoards
+from boards.views       import (
+    DETAIL_FIELDS, EmptyContents, InvalidContents, BoardItem, BoardRow, BoardUpdatedAt, CreateBoard, DeleteBoard, ListPage, ListValidators,
+    ParseFields, ParseListQuery, ResolveWriter, UpdateBoard, VerifyBoardInput, WriteFailure, WriterParams
+)
+from core.auth          import authentication
+from core.pagination    import DecodeRankCursor
+from core.response      import JsonResponse
+
+class AsyncView(View):
+    """
+    # ASGI용 비동기 view (Django 3.2의 View는 async handler를 지원하지 않으므로 직접 dispatch)
+    # 입력 검증, 직렬화는 event loop에서, DB와 cache 호출만 sync_to_async로 thread에 넘김
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        async def view(request, *args, **kwargs):
+            self = cls(**initkwargs)
+            self.setup(request, *args, **kwargs)
+
+            method  = request.method.lower()
+            handler = getattr(self, method, None) if method in self.http_method_names else None
+
+            if handler is None:
+                handler = self.http_method_not_allowed
+
+            #View.options, http_method_not_allowed 같은 기본 handler는 sync이므로 coroutine일 때만 await
+            response = handler(request, *args, **kwargs)
+
+            if asyncio.iscoroutine(response):
+                response = await response
+
+            return response
+
+        #APIView와 마찬가지로 토큰 인증만 사용하므로 CSRF 검사 제외
+        view.csrf_exempt = True
+
+        return view
+
+class AsyncBoardPostingView(AsyncView):
+    """
+    # 게시글 작성
+    """
+
+    @authentication
+    async def post(self, request):
+        try:
+            title, content = VerifyBoardInput(json.loads(request.body))
+
+            await sync_to_async(CreateBoard)(request.user, title, content)
+
+            return JsonResponse({ "MESSAGE" : "CREATED" }, status = 201)
+
+        except IntegrityError:
+            return JsonResponse({ "MESSAGE" : "INVALID USER" }, status = 403)
+
+        except KeyError:
+            return JsonResponse({ "MESSAGE" : "KEY ERROR" }, status = 400)
+
+        except EmptyContents:
+            return JsonResponse({ "MESSAGE" : "PLEASE INPUT CONTENTS" }, status = 400)
+
+        except InvalidContents:
+            return JsonResponse({ "MESSAGE" : "INVALID CONTENTS" }, status = 400)
+
+class AsyncBoardListView(AsyncView):
+    """
+    # 게시글 전체 조회
+    # 기본은 offset=&limit= 방식, paginate=cursor로 요청하면 응답의 NEXT를 cursor=로 넘겨 다음 페이지 조회
+    """
+
+    async def get(self, request):
+        try:
+            writer_id, nickname = WriterParams(request)
+
+            if nickname:
+                writer_id = await sync_to_async(ResolveWriter)(nickname)
+
+            query = ParseListQuery(request, writer_id)
+
+            version, etag, last_modified = await sync_to_async(ListValidators)(query)
+
+            not_modified = NotModified(request, etag, last_modified)
+            if not_modified is not None:
+                return not_modified
+
+            payload = await sync_to_async(ListPage)(version, query)
+
+            return SetValidators(JsonResponse(payload, status = 200), etag, last_modified)
+
+        except ValueError:
+            return JsonResponse({ "MESSAGE" : "INPUT ERROR" }, status = 400)
+
+class AsyncBoardSearchView(AsyncView):
+    """
+    # 게시글 검색
+    """
+
+    async def get(self, request):
+        try:
+            QUERY  = request.GET.get("q", "").strip()
+            LIMIT  = int(request.GET.get("limit", 4))
+            CURSOR = request.GET.get("cursor")
+
+            if not QUERY or LIMIT < 0:
+                raise ValueError
+
+            cursor_position = DecodeRankCursor(CURSOR) if CURSOR else None
+            payload         = await sync_to_async(SearchBoards)(QUERY, LIMIT, cursor_position)
+
+            return JsonResponse(payload, status = 200)
+
+        except ValueError:
+            return JsonResponse({ "MESSAGE" : "INPUT ERROR" }, status = 400)
+
+class AsyncBoardView(AsyncView):
+    """
+    # 게시글 상세 조회, 수정, 삭제
+    """
+
+    async def get(self, request, board_id):
+        try:
+            FIELDS = ParseFields(request.GET.get("fields"), DETAIL_FIELDS)
+
+            if HasConditionalHeaders(request):
+                updated_at = await sync_to_async(BoardUpdatedAt)(board_id)
+
+                if updated_at is None:
+                    raise Board.DoesNotExist
+
+                not_modified = NotModified(request, BoardETag(board_id, updated_at), updated_at.timestamp())
+                if not_modified is not None:
+                    return not_modified
+
+            board = await sync_to_async(BoardRow)(board_id, FIELDS)
+
+            if board is None:
+                raise Board.DoesNotExist
+
+            response = JsonResponse({ "RESULT" : BoardItem(board, FIELDS) }, status = 200)
+
+            return SetValidators(response, BoardETag(board_id, board["updated_at"]), board["updated_at"].timestamp())
+
+        except Board.DoesNotExist:
+            return JsonResponse({ "MESSAGE" : "BOARD DOES NOT EXIST" }, status = 400)
+
+        except ValueError:
+            return JsonResponse({ "MESSAGE" : "INPUT ERROR" }, status = 400)
+
+    @authentication
+    async def patch(self, request, board_id):
+        try:
+            title, content = VerifyBoardInput(json.loads(request.body))
+
+            updated_at = await sync_to_async(UpdateBoard)(request.user.id, board_id, IfMatchTimes(request, board_id), title, content)
+
+            if updated_at is None:
+                return await self.write_failed(request, board_id)
+
+            response = JsonResponse({ "MESSAGE" : "UPDATED" }, status = 201)
+
+            return SetValidators(response, BoardETag(board_id, updated_at), updated_at.timestamp())
+
+        except KeyError:
+            return JsonResponse({ "MESSAGE" : "KEY ERROR" }, status = 400)
+
+        except EmptyContents:
+            return JsonResponse({ "MESSAGE" : "PLEASE INPUT CONTENTS" }, status = 400)
+
+        except InvalidContents:
+            return JsonResponse({ "MESSAGE" : "INVALID CONTENTS" }, status = 400)
+
+    @authentication
+    async def delete(self, request, board_id):
+        if not await sync_to_async(DeleteBoard)(request.user.id, board_id, IfMatchTimes(request, board_id)):
+            return await self.write_failed(request, board_id)
+
+        return HttpResponse(status = 204)
+
+    async def write_failed(self, request, board_id):
+        message, status = await sync_to_async(WriteFailure)(request.user.id, board_id)
+
+        return JsonResponse({ "MESSAGE" : message }, status = status)
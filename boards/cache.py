@@ -0,0 +1,123 @@
+import threading, time
+
+from django.conf              import settings
+from django.core.cache        import caches
+from django.db.models         import Max
+from django.db.models.signals import post_save, post_delete
+from django.dispatch          import receiver
+
+from boards.models import Board
+from core.metrics  import RegisterMetrics
+from core.router   import ReplicaAlias, pinned_to_primary
+
+LIST_VERSION_KEY  = "boards:list:version"
+LIST_MODIFIED_KEY = "boards:list:modified"
+
+class CacheStats:
+    """
+    # 게시글 목록 캐시의 hit / miss 집계
+    """
+
+    def __init__(self):
+        self.lock   = threading.Lock()
+        self.hits   = 0
+        self.misses = 0
+
+    def hit(self):
+        with self.lock:
+            self.hits += 1
+
+    def miss(self):
+        with self.lock:
+            self.misses += 1
+
+    def clear(self):
+        with self.lock:
+            self.hits   = 0
+            self.misses = 0
+
+    def stats(self):
+        with self.lock:
+            total = self.hits + self.misses
+
+            return {
+                "hits"      : self.hits,
+                "misses"    : self.misses,
+                "hit_ratio" : self.hits / total if total else 0.0,
+            }
+
+list_cache_stats = CacheStats()
+RegisterMetrics("board_list_cache", list_cache_stats.stats)
+
+def GetListCache():
+    return caches[getattr(settings, "BOARD_LIST_CACHE_ALIAS", "default")]
+
+def NewListVersion():
+    #version key가 cache에서 밀려나도 이전 값으로 돌아가지 않도록 현재 시각을 시작 값으로 사용
+    return time.time_ns() // 1000
+
+def GetListVersion():
+    cache   = GetListCache()
+    version = cache.get(LIST_VERSION_KEY)
+
+    if version is None:
+        cache.add(LIST_VERSION_KEY, NewListVersion(), timeout = None)
+        version = cache.get(LIST_VERSION_KEY)
+
+    return version
+
+def BumpListVersion():
+    #버전이 바뀌면 이전 버전의 key는 더 이상 조회되지 않고 timeout으로 사라짐
+    cache = GetListCache()
+
+    try:
+        cache.incr(LIST_VERSION_KEY)
+    except ValueError:
+        cache.set(LIST_VERSION_KEY, NewListVersion(), timeout = None)
+
+    #삭제는 updated_at의 최댓값을 바꾸지 않으므로 마지막 변경 시각을 따로 기록
+    cache.set(LIST_MODIFIED_KEY, time.time(), timeout = None)
+
+def GetListModified(version):
+    #목록의 Last-Modified (epoch seconds), 버전마다 한 번만 계산
+    cache    = GetListCache()
+    key      = f"boards:list:{version}:modified"
+    modified = cache.get(key)
+
+    if modified is None:
+        latest   = Board.objects.aggregate(latest = Max("updated_at"))["latest"]
+        modified = max(
+            latest.timestamp() if latest else 0,
+            cache.get(LIST_MODIFIED_KEY, 0)
+        )
+        cache.set(key, modified, timeout = getattr(settings, "BOARD_LIST_CACHE_TIMEOUT", 60))
+
+    return modified
+
+def ReadsFromReplica():
+    return not pinned_to_primary.get() and ReplicaAlias() is not None
+
+def GetListPage(version, key_parts, build):
+    cache   = GetListCache()
+    key     = ":".join(["boards:list", str(version)] + [str(part) for part in key_parts])
+    payload = cache.get(key)
+
+    if payload is not None:
+        list_cache_stats.hit()
+        return payload
+
+    list_cache_stats.miss()
+    payload = build()
+
+    #마지막 쓰기 후 REPLICA_PIN_SECONDS(replica 지연 허용치) 안에 replica로 만든 페이지는 그 쓰기가 빠져 있을 수 있으므로
+    #방금 올린 version으로 캐시하지 않음, 이 동안 캐시되는 페이지는 primary로 만든 것뿐이라 고정된 요청도 캐시를 사용할 수 있음
+    if ReadsFromReplica() and time.time() - cache.get(LIST_MODIFIED_KEY, 0) < getattr(settings, "REPLICA_PIN_SECONDS", 5):
+        return payload
+
+    cache.set(key, payload, timeout = getattr(settings, "BOARD_LIST_CACHE_TIMEOUT", 60))
+
+    return payload
+
+@receiver([post_save, post_delete], sender = Board)
+def invalidate_board_list(sender, **kwargs):
+    BumpListVersion()
@@ -0,0 +1,53 @@
+import hashlib
+
+from datetime import datetime
+
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http  import http_date, parse_etags
+
+ETAG_TIME_FORMAT = "%Y%m%d%H%M%S%f"
+
+def BoardETag(board_id, updated_at):
+    return quote_etag(f"{board_id}-{updated_at.strftime(ETAG_TIME_FORMAT)}")
+
+def IfMatchTimes(request, board_id):
+    #If-Match의 ETag를 updated_at 목록으로 변환, 헤더가 없거나 "*"이면 None
+    if_match = request.headers.get("If-Match")
+
+    if if_match is None or if_match.strip() == "*":
+        return None
+
+    times = []
+
+    for etag in parse_etags(if_match):
+        #If-Match는 strong 비교이므로 weak ETag나 형식이 다른 값은 어떤 버전과도 일치하지 않음
+        tag_id, _, tag_time = etag.strip('"').partition("-")
+
+        try:
+            if tag_id == str(board_id) and not etag.startswith("W/"):
+                times.append(datetime.strptime(tag_time, ETAG_TIME_FORMAT))
+
+        except ValueError:
+            continue
+
+    return times
+
+def ListETag(version, key_parts):
+    key = ":".join([str(version)] + [str(part) for part in key_parts])
+
+    return quote_etag(hashlib.md5(key.encode("utf-8")).hexdigest())
+
+def HasConditionalHeaders(request):
+    return "If-None-Match" in request.headers or "If-Modified-Since" in request.headers
+
+def NotModified(request, etag, last_modified):
+    #조건이 맞으면 304 응답, 아니면 None
+    response = get_conditional_response(request, etag = etag, last_modified = int(last_modified))
+
+    return SetValidators(response, etag, last_modified) if response is not None else None
+
+def SetValidators(response, etag, last_modified):
+    response["ETag"]          = etag
+    response["Last-Modified"] = http_date(last_modified)
+
+    return response
@@ -0,0 +1,32 @@
+from django.db        import transaction
+from django.db.models import F
+
+from boards.cache  import BumpListVersion
+from boards.models import Board, BoardCounter
+
+TOTAL_COUNTER = "total"
+
+def AddBoardCount(delta):
+    #게시글을 만들거나 지운 transaction 안에서 UPDATE 한 번으로 증감
+    if delta:
+        BoardCounter.objects.filter(name = TOTAL_COUNTER).update(value = F("value") + delta)
+
+def GetBoardCount():
+    #행이 없으면 (reconcile 전) None
+    return BoardCounter.objects.filter(name = TOTAL_COUNTER).values_list("value", flat = True).first()
+
+def ReconcileBoardCount():
+    #signal 없이 지워진 게시글(유저 삭제 cascade, 관리자 작업 등)로 어긋난 값을 COUNT(*)로 보정
+    with transaction.atomic():
+        total      = Board.objects.count()
+        counter, _ = BoardCounter.objects.get_or_create(name = TOTAL_COUNTER)
+        previous   = counter.value
+
+        if previous != total:
+            BoardCounter.objects.filter(name = TOTAL_COUNTER).update(value = total)
+
+    if previous != total:
+        #캐시된 목록 응답의 TOTAL도 새 값으로 바뀌도록 version 갱신
+        BumpListVersion()
+
+    return previous, total
@@ -0,0 +1,30 @@
+from django.conf import settings
+
+from boards.models  import Board
+from core.response import DumpJson, FormatDateTime
+
+def ExportBoards(since = None):
+    #id 기준 keyset으로 batch를 나눠 읽으므로 테이블 크기와 관계없이 메모리 사용량이 일정
+    batch_size = getattr(settings, "BOARD_EXPORT_BATCH_SIZE", 1000)
+    boards     = Board.objects.order_by("id")
+    last_id    = 0
+
+    if since is not None:
+        boards = boards.filter(updated_at__gte = since)
+
+    while True:
+        batch = list(boards.filter(id__gt = last_id)[:batch_size])
+
+        if not batch:
+            return
+
+        for board in batch:
+            yield DumpJson({
+                "content"      : board.content,
+                "id"           : board.id,
+                "title"        : board.title,
+                "updated time" : FormatDateTime(board.updated_at),
+                "writer"       : board.writer_nickname,
+            }) + b"\n"
+
+        last_id = batch[-1].id
@@ -0,0 +1,49 @@
+import asyncio, time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.test                 import Client, AsyncClient
+
+class Command(BaseCommand):
+    help = "같은 게시글 조회 요청을 WSGI(동기 view)와 ASGI(비동기 view) 경로로 보내 처리량을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type = int, default = 1000)
+        parser.add_argument("--concurrency", type = int, default = 32)
+        parser.add_argument("--path", default = "?offset=0&limit=20")
+
+    def handle(self, *args, **options):
+        total       = options["requests"]
+        concurrency = options["concurrency"]
+        path        = options["path"]
+
+        wsgi_elapsed = self.run_wsgi(f"/boards{path}", total, concurrency)
+        asgi_elapsed = asyncio.run(self.run_asgi(f"/async/boards{path}", total, concurrency))
+
+        self.stdout.write(f"{'path':<8}{'requests':>10}{'seconds':>10}{'req/s':>10}")
+        for name, elapsed in (("wsgi", wsgi_elapsed), ("asgi", asgi_elapsed)):
+            self.stdout.write(f"{name:<8}{total:>10}{elapsed:>10.2f}{total / elapsed:>10.1f}")
+
+    def run_wsgi(self, url, total, concurrency):
+        def request(_):
+            return Client().get(url).status_code
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers = concurrency) as executor:
+            list(executor.map(request, range(total)))
+
+        return time.perf_counter() - start
+
+    async def run_asgi(self, url, total, concurrency):
+        semaphore = asyncio.Semaphore(concurrency)
+        client    = AsyncClient()
+
+        async def request():
+            async with semaphore:
+                return (await client.get(url)).status_code
+
+        start = time.perf_counter()
+        await asyncio.gather(*(request() for _ in range(total)))
+
+        return time.perf_counter() - start
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db                   import connections
+
+from boards.migrations._search_triggers import SEARCH_TRIGGERS
+
+class Command(BaseCommand):
+    help = "게시글 전문 검색(FTS5) 인덱스를 boards 테이블 기준으로 다시 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default = "default")
+
+    def handle(self, *args, **options):
+        connection = connections[options["database"]]
+
+        if connection.vendor != "sqlite":
+            raise CommandError("SEARCH INDEX IS ONLY SUPPORTED ON SQLITE")
+
+        with connection.cursor() as cursor:
+            #예전 migration으로 trigger가 빠진 DB도 복구
+            for sql in SEARCH_TRIGGERS:
+                cursor.execute(sql)
+
+            cursor.execute("INSERT INTO boards_fts(boards_fts) VALUES ('rebuild')")
+            cursor.execute("INSERT INTO boards_fts(boards_fts) VALUES ('optimize')")
+
+        self.stdout.write(self.style.SUCCESS("SEARCH INDEX REBUILT"))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from boards.counter import ReconcileBoardCount
+
+class Command(BaseCommand):
+    help = "목록 응답에 쓰는 게시글 전체 개수를 COUNT(*)로 다시 계산합니다. cron 등으로 주기적으로 실행합니다."
+
+    def handle(self, *args, **options):
+        previous, total = ReconcileBoardCount()
+
+        self.stdout.write(self.style.SUCCESS(f"BOARD COUNT {previous} -> {total}"))
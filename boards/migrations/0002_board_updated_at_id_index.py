@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-18 23:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='board',
+            index=models.Index(fields=['updated_at', 'id'], name='boards_updated_id_idx'),
+        ),
+    ]
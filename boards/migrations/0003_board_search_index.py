@@ -0,0 +1,52 @@
+from django.db import migrations
+
+from boards.migrations._search_triggers import SEARCH_TRIGGERS
+
+#trigger SQL은 이후 migration과 함께 쓰는 _search_triggers의 고정된 사본 하나만 사용
+CREATE_SEARCH_INDEX = [
+    """
+    CREATE VIRTUAL TABLE boards_fts USING fts5(
+        title,
+        content,
+        content = 'boards',
+        content_rowid = 'id',
+        tokenize = 'unicode61',
+        prefix = '2 3'
+    )
+    """,
+    *SEARCH_TRIGGERS,
+    "INSERT INTO boards_fts(boards_fts) VALUES ('rebuild')",
+]
+
+DROP_SEARCH_INDEX = [
+    "DROP TRIGGER IF EXISTS boards_fts_update",
+    "DROP TRIGGER IF EXISTS boards_fts_delete",
+    "DROP TRIGGER IF EXISTS boards_fts_insert",
+    "DROP TABLE IF EXISTS boards_fts",
+]
+
+def create_search_index(apps, schema_editor):
+    #FTS5 검색 인덱스는 SQLite에서만 생성
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    for sql in CREATE_SEARCH_INDEX:
+        schema_editor.execute(sql)
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    for sql in DROP_SEARCH_INDEX:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0002_board_updated_at_id_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 3.2.25 on 2026-10-18 23:59
+
+from django.db        import migrations, models
+from django.db.models import OuterRef, Subquery
+
+from boards.migrations._search_triggers import restore_search_triggers
+
+def backfill_writer_nickname(apps, schema_editor):
+    Board = apps.get_model('boards', 'Board')
+    User  = apps.get_model('users', 'User')
+
+    Board.objects.update(
+        writer_nickname = Subquery(User.objects.filter(id = OuterRef('writer_id')).values('nickname')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0003_board_search_index'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        #되돌릴 때도 RemoveField가 테이블을 다시 만든 뒤 trigger를 복구하도록 맨 앞에 배치
+        migrations.RunPython(migrations.RunPython.noop, restore_search_triggers),
+        migrations.RemoveIndex(
+            model_name='board',
+            name='boards_updated_id_idx',
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='writer_nickname',
+            field=models.CharField(default='', max_length=32),
+        ),
+        migrations.RunPython(backfill_writer_nickname, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='board',
+            index=models.Index(fields=['updated_at', 'id', 'title', 'writer_nickname'], name='boards_list_covering_idx'),
+        ),
+        migrations.RunPython(restore_search_triggers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 3.2.25 on 2026-10-19 00:02
+
+from django.db         import migrations, models
+from django.utils.html import strip_tags
+
+from boards.migrations._search_triggers import restore_search_triggers
+
+#migration 결과가 BOARD_PREVIEW_LENGTH나 boards.preview 변경에 따라 달라지지 않도록 작성 당시의 규칙을 고정
+PREVIEW_LENGTH = 100
+
+def build_preview(content):
+    text = " ".join((strip_tags(content) if "<" in content else content).split())
+
+    if len(text) <= PREVIEW_LENGTH:
+        return text
+
+    return text[:PREVIEW_LENGTH - 3].rstrip() + "..."
+
+def backfill_preview(apps, schema_editor):
+    #id 기준 batch로 나눠 content를 읽고 preview, content_length 저장
+    Board   = apps.get_model('boards', 'Board')
+    last_id = 0
+
+    while True:
+        boards = list(Board.objects.filter(id__gt = last_id).order_by('id').only('id', 'content')[:1000])
+
+        if not boards:
+            return
+
+        for board in boards:
+            board.preview        = build_preview(board.content)
+            board.content_length = len(board.content)
+
+        Board.objects.bulk_update(boards, ['preview', 'content_length'])
+        last_id = boards[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0004_board_writer_nickname'),
+    ]
+
+    operations = [
+        migrations.RunPython(migrations.RunPython.noop, restore_search_triggers),
+        migrations.AddField(
+            model_name='board',
+            name='content_length',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='preview',
+            field=models.CharField(default='', max_length=200),
+        ),
+        migrations.RunPython(backfill_preview, migrations.RunPython.noop),
+        migrations.RunPython(restore_search_triggers, migrations.RunPython.noop),
+    ]
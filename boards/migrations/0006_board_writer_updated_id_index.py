@@ -0,0 +1,28 @@
+# Generated by Django 3.2.25 on 2026-10-19 00:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+from boards.migrations._search_triggers import restore_search_triggers
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+        ('boards', '0005_board_preview'),
+    ]
+
+    operations = [
+        migrations.RunPython(migrations.RunPython.noop, restore_search_triggers),
+        migrations.AlterField(
+            model_name='board',
+            name='writer',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='users.user'),
+        ),
+        migrations.AddIndex(
+            model_name='board',
+            index=models.Index(fields=['writer', 'updated_at', 'id'], name='boards_writer_updated_id_idx'),
+        ),
+        migrations.RunPython(restore_search_triggers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 3.2.25 on 2026-10-19 00:14
+
+from django.db import migrations, models
+
+def create_total_counter(apps, schema_editor):
+    #이후에는 작성, 삭제 시 증감하고 reconcile_board_count로 보정
+    Board        = apps.get_model('boards', 'Board')
+    BoardCounter = apps.get_model('boards', 'BoardCounter')
+
+    BoardCounter.objects.create(name = 'total', value = Board.objects.count())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0006_board_writer_updated_id_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardCounter',
+            fields=[
+                ('name', models.CharField(max_length=32, primary_key=True, serialize=False)),
+                ('value', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'board_counters',
+            },
+        ),
+        migrations.RunPython(create_total_counter, migrations.RunPython.noop),
+    ]
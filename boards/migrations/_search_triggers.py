@@ -0,0 +1,30 @@
+#boards_fts를 갱신하는 FTS5 trigger의 고정된 SQL (migration 모듈이 아니므로 Django가 migration으로 읽지 않음)
+#SQLite는 AddField, AlterField 등으로 boards 테이블을 다시 만들 때 trigger도 함께 삭제하므로 그런 migration마다 다시 생성
+#migration 결과가 이후 코드 변경에 따라 달라지지 않도록 이 파일은 수정하지 않고, trigger가 바뀌면 새 상수를 추가
+
+SEARCH_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS boards_fts_insert AFTER INSERT ON boards BEGIN
+        INSERT INTO boards_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS boards_fts_delete AFTER DELETE ON boards BEGIN
+        INSERT INTO boards_fts(boards_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS boards_fts_update AFTER UPDATE OF title, content ON boards BEGIN
+        INSERT INTO boards_fts(boards_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO boards_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+]
+
+def restore_search_triggers(apps, schema_editor):
+    #boards 테이블을 다시 만들면서 삭제된 FTS5 trigger 복구 (FTS5 검색 인덱스는 SQLite에서만 사용)
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    for sql in SEARCH_TRIGGERS:
+        schema_editor.execute(sql)
@@ -5,9 +5,29 @@ from django.db import models
 from core.models import TimeStamp
 
 class Board(TimeStamp):
-    writer       = models.ForeignKey('users.User', on_delete = models.CASCADE)
-    title        = models.CharField(db_index = True, max_length = 128)
-    content      = models.TextField()
+    writer          = models.ForeignKey('users.User', on_delete = models.CASCADE, db_index = False)
+    writer_nickname = models.CharField(max_length = 32, default = "")
+    title           = models.CharField(db_index = True, max_length = 128)
+    content         = models.TextField()
+    preview         = models.CharField(max_length = 200, default = "")
+    content_length  = models.PositiveIntegerField(default = 0)
 
     class Meta:
-        db_table = "boards"
\ No newline at end of file
+        #SQLite는 AddField, AlterField 등으로 boards 테이블을 다시 만들 때 FTS5 검색 trigger도 삭제하므로
+        #그런 migration에는 앞뒤로 RunPython(restore_search_triggers)를 넣어야 함 (boards/migrations/_search_triggers.py, 0004 참고)
+        #빠뜨리면 BoardSearchTest.test_search_triggers_exist가 실패
+        db_table = "boards"
+        indexes  = [
+            #목록 조회 컬럼을 모두 포함하므로 boards 테이블을 읽지 않고 인덱스만으로 응답
+            models.Index(fields = ["updated_at", "id", "title", "writer_nickname"], name = "boards_list_covering_idx"),
+            #작성자별 목록을 정렬 없이 조회, writer_id 단독 인덱스도 대신함
+            models.Index(fields = ["writer", "updated_at", "id"], name = "boards_writer_updated_id_idx"),
+        ]
+
+class BoardCounter(models.Model):
+    #목록 응답의 전체 개수처럼 요청마다 COUNT(*)로 구하기 비싼 값을 보관하는 행
+    name  = models.CharField(max_length = 32, primary_key = True)
+    value = models.BigIntegerField(default = 0)
+
+    class Meta:
+        db_table = "board_counters"
\ No newline at end of file
@@ -0,0 +1,21 @@
+from django.conf       import settings
+from django.utils.html import strip_tags
+
+PREVIEW_MAX_LENGTH = 200
+
+def BuildPreview(content):
+    #태그를 제거하고 공백을 하나로 합친 뒤 앞부분만 남김 (HTML parser는 태그가 있을 때만 사용)
+    text   = " ".join((strip_tags(content) if "<" in content else content).split())
+    length = min(getattr(settings, "BOARD_PREVIEW_LENGTH", 100), PREVIEW_MAX_LENGTH)
+
+    if len(text) <= length:
+        return text
+
+    return text[:length - 3].rstrip() + "..."
+
+def PreviewFields(content):
+    #목록에서 content를 읽지 않도록 작성 시점에 함께 저장하는 값
+    return {
+        "preview"        : BuildPreview(content),
+        "content_length" : len(content),
+    }
@@ -0,0 +1,49 @@
+from boards.models   import Board
+from core.pagination import EncodeRankCursor
+from core.response   import FormatDateTime
+
+SEARCH_SQL = """
+    SELECT boards.id, boards.title, boards.updated_at, boards.writer_nickname, boards_fts.rank AS search_rank
+    FROM boards_fts
+    JOIN boards ON boards.id = boards_fts.rowid
+    WHERE boards_fts MATCH %s {after}
+    ORDER BY boards_fts.rank, boards.id
+    LIMIT %s
+"""
+
+SEARCH_AFTER_SQL = "AND (boards_fts.rank > %s OR (boards_fts.rank = %s AND boards.id > %s))"
+
+def BuildMatchQuery(q):
+    #입력을 단어 단위 prefix 검색으로 변환 (FTS5 문법 문자는 모두 문자열로 취급)
+    terms = ['"' + term.replace('"', '""') + '"*' for term in q.split()]
+
+    return " ".join(terms)
+
+def SearchBoards(q, limit, cursor_position = None):
+    match = BuildMatchQuery(q)
+
+    if cursor_position:
+        rank, board_id = cursor_position
+        sql            = SEARCH_SQL.format(after = SEARCH_AFTER_SQL)
+        params         = [match, rank, rank, board_id, limit + 1]
+    else:
+        sql    = SEARCH_SQL.format(after = "")
+        params = [match, limit + 1]
+
+    boards      = list(Board.objects.raw(sql, params))
+    next_cursor = None
+
+    if len(boards) > limit:
+        boards      = boards[:limit]
+        next_cursor = EncodeRankCursor(boards[-1].search_rank, boards[-1].id) if boards else None
+
+    return {
+        "RESULT" : [
+            {
+                "updated time" : FormatDateTime(board.updated_at),
+                "id"           : board.id,
+                "writer"       : board.writer_nickname,
+                "title"        : board.title,
+            } for board in boards],
+        "NEXT"   : next_cursor
+    }
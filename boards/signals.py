@@ -0,0 +1,34 @@
+from django.db.models.signals import pre_save, post_save
+from django.dispatch          import receiver
+
+from boards.cache   import BumpListVersion
+from boards.models  import Board
+from boards.preview import PreviewFields
+from users.models   import User
+
+@receiver(pre_save, sender = Board)
+def fill_writer_nickname(sender, instance, **kwargs):
+    #writer_nickname 없이 저장되는 게시글은 writer에서 채움
+    if not instance.writer_nickname and instance.writer_id is not None:
+        instance.writer_nickname = instance.writer.nickname
+
+@receiver(pre_save, sender = Board)
+def fill_preview(sender, instance, **kwargs):
+    #preview 없이 저장되는 게시글은 content에서 계산
+    if not instance.preview and instance.content:
+        for name, value in PreviewFields(instance.content).items():
+            setattr(instance, name, value)
+
+@receiver(post_save, sender = User)
+def sync_writer_nickname(sender, instance, created, update_fields = None, **kwargs):
+    #닉네임이 바뀌면 해당 유저의 게시글에 복사된 닉네임도 갱신
+    if created or (update_fields is not None and "nickname" not in update_fields):
+        return
+
+    updated = Board.objects.filter(writer_id = instance.id).exclude(writer_nickname = instance.nickname).update(
+        writer_nickname = instance.nickname
+    )
+
+    #update()는 signal을 보내지 않으므로 목록 캐시를 직접 무효화
+    if updated:
+        BumpListVersion()
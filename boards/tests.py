@@ -1,12 +1,20 @@
 from django.http import request, response
-import jwt, json
+import jwt, json, gzip
 from datetime import datetime
+from io       import StringIO
+from unittest.mock import patch
 
-from django.test import TestCase, Client
+from django.core.cache      import cache
+from django.core.management import call_command
+from django.db              import connection
+from django.test            import TestCase, Client, AsyncClient, override_settings
+from django.test.utils      import CaptureQueriesContext
 
-from boards.models import Board
-from users.models  import User
-from my_settings   import SECRET_KEY
+from boards.cache   import list_cache_stats
+from boards.counter import GetBoardCount, ReconcileBoardCount
+from boards.models  import Board
+from users.models   import User
+from my_settings    import SECRET_KEY
 
 class BoardCreateTest(TestCase):
     def setUp(self):
@@ -32,6 +40,37 @@ class BoardCreateTest(TestCase):
         self.assertEqual(response.json(), { "MESSAGE" : "CREATED" })
         self.assertEqual(response.status_code, 201)
         
+    def test_BoardPostingView_post_writer_nickname(self):
+        client = Client()
+        header = { "HTTP_Authorization" : self.token }
+        client.post('/boards/write', json.dumps({ "title" : "제목", "content" : "내용" }), content_type = "application/json", **header)
+
+        self.assertEqual(Board.objects.get().writer_nickname, "orange")
+
+    def test_BoardPostingView_post_writer_nickname_not_stale(self):
+        client = Client()
+        header = { "HTTP_Authorization" : self.token }
+        client.post('/boards/write', json.dumps({ "title" : "제목", "content" : "내용" }), content_type = "application/json", **header)
+
+        #signal과 인증 캐시를 거치지 않고 닉네임이 바뀐 상황
+        User.objects.filter(nickname = "orange").update(nickname = "apple")
+
+        client.post('/boards/write', json.dumps({ "title" : "제목", "content" : "내용" }), content_type = "application/json", **header)
+        client.post('/boards/bulk', json.dumps([{ "title" : "제목", "content" : "내용" }]), content_type = "application/json", **header)
+
+        self.assertEqual(list(Board.objects.order_by("id").values_list("writer_nickname", flat = True)), ["orange", "apple", "apple"])
+
+    @override_settings(BOARD_PREVIEW_LENGTH = 10)
+    def test_BoardPostingView_post_preview(self):
+        client  = Client()
+        header  = { "HTTP_Authorization" : self.token }
+        content = "<p>첫 번째   <b>문단</b>입니다.</p>\n<p>두 번째 문단</p>"
+        client.post('/boards/write', json.dumps({ "title" : "제목", "content" : content }), content_type = "application/json", **header)
+
+        board = Board.objects.get()
+        self.assertEqual(board.preview, "첫 번째 문단...")
+        self.assertEqual(board.content_length, len(content))
+
     def test_BoardPostingView_post_empty_input_title(self):
         client     = Client()
         header     = { "HTTP_Authorization" : self.token }
@@ -65,8 +104,108 @@ class BoardCreateTest(TestCase):
         self.assertEqual(response.json(), { "MESSAGE" : "KEY ERROR" })
         self.assertEqual(response.status_code, 400)
 
+    def test_BoardPostingView_post_invalid_content(self):
+        client     = Client()
+        header     = { "HTTP_Authorization" : self.token }
+        board_data = {
+            "title"   : "게시판 등록",
+            "content" : 123
+        }
+        response = client.post('/boards/write', json.dumps(board_data), content_type = "application/json", **header)
+        self.assertEqual(response.json(), { "MESSAGE" : "INVALID CONTENTS" })
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Board.objects.exists())
+
+class BoardBulkCreateTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+        user = User.objects.create(
+            nickname = "orange",
+            password = "pass1234!@"
+        )
+
+        self.token = jwt.encode({ "id" : user.id }, SECRET_KEY, algorithm = "HS256")
+
+    def tearDown(self):
+        User.objects.all().delete()
+        Board.objects.all().delete()
+
+    def test_BoardBulkPostingView_post_json_array(self):
+        client     = Client()
+        header     = { "HTTP_Authorization" : self.token }
+        board_data = [
+            {
+                "title"   : f"{i}번째 게시글",
+                "content" : "내용을 입력해 주세요."
+            } for i in range(1, 6)
+        ]
+        response = client.post('/boards/bulk', json.dumps(board_data), content_type = "application/json", **header)
+        self.assertEqual(response.json(), { "MESSAGE" : "CREATED", "CREATED" : 5, "ERRORS" : [] })
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Board.objects.count(), 5)
+        self.assertEqual(set(Board.objects.values_list("preview", "content_length")), { ("내용을 입력해 주세요.", 12) })
+
+    def test_BoardBulkPostingView_post_ndjson_with_errors(self):
+        client = Client()
+        header = { "HTTP_Authorization" : self.token }
+        body   = "\n".join([
+            json.dumps({ "title" : "게시판 등록", "content" : "내용을 입력해 주세요." }),
+            json.dumps({ "titel" : "게시판 등록", "content" : "내용을 입력해 주세요." }),
+            json.dumps({ "title" : "", "content" : "내용을 입력해 주세요." }),
+        ])
+        response = client.post('/boards/bulk', body, content_type = "application/x-ndjson", **header)
+        self.assertEqual(response.json(), {
+            "MESSAGE" : "CREATED",
+            "CREATED" : 1,
+            "ERRORS"  : [
+                { "index" : 1, "MESSAGE" : "KEY ERROR" },
+                { "index" : 2, "MESSAGE" : "PLEASE INPUT CONTENTS" },
+            ]
+        })
+        self.assertEqual(response.status_code, 201)
+
+    def test_BoardBulkPostingView_post_invalid_content(self):
+        client     = Client()
+        header     = { "HTTP_Authorization" : self.token }
+        board_data = [
+            { "title" : "게시판 등록", "content" : "내용을 입력해 주세요." },
+            { "title" : "게시판 등록", "content" : 123 },
+            { "title" : ["게시판 등록"], "content" : "내용을 입력해 주세요." },
+        ]
+        response = client.post('/boards/bulk', json.dumps(board_data), content_type = "application/json", **header)
+        self.assertEqual(response.json(), {
+            "MESSAGE" : "CREATED",
+            "CREATED" : 1,
+            "ERRORS"  : [
+                { "index" : 1, "MESSAGE" : "INVALID CONTENTS" },
+                { "index" : 2, "MESSAGE" : "INVALID CONTENTS" },
+            ]
+        })
+        self.assertEqual(response.status_code, 201)
+
+    def test_BoardBulkPostingView_post_invalidates_list_cache(self):
+        client = Client()
+        header = { "HTTP_Authorization" : self.token }
+
+        self.assertEqual(client.get('/boards').json()["RESULT"], [])
+
+        board_data = [{ "title" : "게시판 등록", "content" : "내용을 입력해 주세요." }]
+        client.post('/boards/bulk', json.dumps(board_data), content_type = "application/json", **header)
+
+        self.assertEqual(len(client.get('/boards').json()["RESULT"]), 1)
+
+    def test_BoardBulkPostingView_post_input_error(self):
+        client   = Client()
+        header   = { "HTTP_Authorization" : self.token }
+        response = client.post('/boards/bulk', json.dumps({ "title" : "게시판 등록" }), content_type = "application/json", **header)
+        self.assertEqual(response.json(), { "MESSAGE" : "INPUT ERROR" })
+        self.assertEqual(response.status_code, 400)
+
 class BoardReadTest(TestCase):
     def setUp(self):
+        cache.clear()
+
         user = User.objects.create(
             nickname = "orange",
             password = "pass1234!@"
@@ -75,9 +214,10 @@ class BoardReadTest(TestCase):
         Board.objects.bulk_create(
             [
                 Board(
-                    writer  = user,
-                    title   = f"{i}번째 게시글",
-                    content = "내용을 입력해 주세요."
+                    writer          = user,
+                    writer_nickname = user.nickname,
+                    title           = f"{i}번째 게시글",
+                    content         = "내용을 입력해 주세요."
                 ) for i in range(1, 21)
             ]
         )
@@ -114,6 +254,255 @@ class BoardReadTest(TestCase):
         })
         self.assertEqual(response.status_code, 400)
 
+    def test_BoardListView_get_cursor_success(self):
+        client   = Client()
+        response = client.get('/boards?cursor=&limit=8')
+        first    = response.json()
+
+        self.assertEqual([board["id"] for board in first["RESULT"]], list(range(20, 12, -1)))
+        self.assertIsNotNone(first["NEXT"])
+        self.assertEqual(response.status_code, 200)
+
+        response = client.get(f'/boards?cursor={first["NEXT"]}&limit=8')
+        second   = response.json()
+
+        self.assertEqual([board["id"] for board in second["RESULT"]], list(range(12, 4, -1)))
+
+        response = client.get(f'/boards?cursor={second["NEXT"]}&limit=8')
+        last     = response.json()
+
+        self.assertEqual([board["id"] for board in last["RESULT"]], list(range(4, 0, -1)))
+        self.assertIsNone(last["NEXT"])
+
+    def test_BoardListView_get_paginate_cursor(self):
+        client = Client()
+        ids    = []
+        first  = client.get('/boards?paginate=cursor&limit=8').json()
+        cursor = first["NEXT"]
+        ids   += [board["id"] for board in first["RESULT"]]
+
+        while cursor is not None:
+            response = client.get(f'/boards?paginate=cursor&cursor={cursor}&limit=8').json()
+            ids     += [board["id"] for board in response["RESULT"]]
+            cursor   = response["NEXT"]
+
+        self.assertEqual(ids, list(range(20, 0, -1)))
+
+    def test_BoardListView_get_paginate_input_error(self):
+        client = Client()
+
+        for query in ("paginate=page", "paginate=offset&cursor="):
+            response = client.get(f'/boards?{query}')
+
+            self.assertEqual(response.json(), { "MESSAGE" : "INPUT ERROR" })
+            self.assertEqual(response.status_code, 400)
+
+    def test_BoardListView_get_cursor_input_error(self):
+        client   = Client()
+        response = client.get('/boards?cursor=invalid&limit=4')
+
+        self.assertEqual(response.json(), {
+            "MESSAGE" : "INPUT ERROR"
+        })
+        self.assertEqual(response.status_code, 400)
+
+    def test_BoardListView_get_without_users_join(self):
+        client = Client()
+
+        with CaptureQueriesContext(connection) as queries:
+            client.get('/boards?offset=0&limit=4')
+
+        board_queries = [query["sql"] for query in queries if '"boards"' in query["sql"]]
+
+        self.assertTrue(board_queries)
+        self.assertFalse([sql for sql in board_queries if '"users"' in sql or '"content"' in sql])
+
+    def test_BoardListView_get_fields(self):
+        client   = Client()
+        response = client.get('/boards?offset=0&limit=2&fields=id,title')
+
+        self.assertEqual(response.json(), {
+            "RESULT" : [
+                { "id" : 20, "title" : "20번째 게시글" },
+                { "id" : 19, "title" : "19번째 게시글" },
+            ]
+        })
+
+    def test_BoardListView_get_fields_content(self):
+        client = Client()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get('/boards?limit=1&cursor=&fields=id,content')
+
+        self.assertEqual(response.json()["RESULT"], [{ "id" : 20, "content" : "내용을 입력해 주세요." }])
+        self.assertTrue([query for query in queries if '"content"' in query["sql"]])
+
+    def test_BoardListView_get_fields_preview(self):
+        client = Client()
+        Board.objects.create(writer = User.objects.get(nickname = "orange"), title = "미리보기", content = "<b>굵은</b> 글씨")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get('/boards?offset=0&limit=1&fields=id,preview,content_length')
+
+        self.assertEqual(response.json()["RESULT"], [{ "id" : 21, "preview" : "굵은 글씨", "content length" : 12 }])
+        self.assertFalse([query for query in queries if '"content"' in query["sql"]])
+
+    def test_BoardListView_get_fields_input_error(self):
+        client   = Client()
+        response = client.get('/boards?fields=id,password')
+
+        self.assertEqual(response.json(), { "MESSAGE" : "INPUT ERROR" })
+        self.assertEqual(response.status_code, 400)
+
+    def test_BoardListView_get_writer(self):
+        client = Client()
+        user   = User.objects.create(nickname = "apple", password = "pass1234!@")
+
+        for i in range(1, 4):
+            Board.objects.create(writer = user, title = f"apple {i}", content = "내용")
+
+        response = client.get('/boards?writer=apple&limit=10&fields=id,writer')
+        self.assertEqual(response.json()["RESULT"], [{ "id" : i, "writer" : "apple" } for i in [23, 22, 21]])
+
+        response = client.get(f'/boards?writer_id={user.id}&limit=10&fields=id')
+        self.assertEqual(response.json()["RESULT"], [{ "id" : i } for i in [23, 22, 21]])
+
+        response = client.get('/boards?writer=banana')
+        self.assertEqual(response.json()["RESULT"], [])
+
+        response = client.get(f'/boards?writer=apple&writer_id={user.id}')
+        self.assertEqual(response.json(), { "MESSAGE" : "INPUT ERROR" })
+        self.assertEqual(response.status_code, 400)
+
+    def test_BoardListView_get_numeric_writer_nickname(self):
+        client = Client()
+        user   = User.objects.create(nickname = "12345", password = "pass1234!@")
+
+        Board.objects.create(writer = user, title = "숫자 닉네임", content = "내용")
+
+        response = client.get('/boards?writer=12345&fields=title,writer')
+        self.assertEqual(response.json()["RESULT"], [{ "title" : "숫자 닉네임", "writer" : "12345" }])
+
+    def test_UserBoardListView_get_cursor(self):
+        client = Client()
+        user   = User.objects.get(nickname = "orange")
+        ids    = []
+        cursor = ""
+
+        while cursor is not None:
+            response = client.get(f'/user/{user.id}/boards?limit=8&cursor={cursor}').json()
+            ids     += [board["id"] for board in response["RESULT"]]
+            cursor   = response["NEXT"]
+
+        self.assertEqual(ids, list(range(20, 0, -1)))
+        self.assertEqual(client.get('/user/100/boards').json()["RESULT"], [])
+
+    def test_BoardListView_get_writer_nickname_synced(self):
+        client = Client()
+        client.get('/boards?offset=0&limit=4')
+
+        user          = User.objects.get(nickname = "orange")
+        user.nickname = "apple"
+        user.save()
+
+        response = client.get('/boards?offset=0&limit=4')
+
+        self.assertEqual({ board["writer"] for board in response.json()["RESULT"] }, { "apple" })
+        self.assertFalse(Board.objects.exclude(writer_nickname = "apple").exists())
+
+    def test_BoardListView_get_cached(self):
+        client = Client()
+        list_cache_stats.clear()
+
+        first = client.get('/boards?offset=0&limit=4').json()
+
+        with self.assertNumQueries(0):
+            response = client.get('/boards?offset=0&limit=4')
+
+        self.assertEqual(response.json(), first)
+        self.assertEqual(list_cache_stats.stats(), { "hits" : 1, "misses" : 1, "hit_ratio" : 0.5 })
+
+    @patch("boards.cache.ReplicaAlias", return_value = "replica")
+    def test_BoardListView_get_replica_page_not_cached_after_write(self, replica_alias):
+        client = Client()
+        list_cache_stats.clear()
+
+        Board.objects.create(
+            writer  = User.objects.get(nickname = "orange"),
+            title   = "21번째 게시글",
+            content = "내용을 입력해 주세요."
+        )
+
+        #쓰기 직후 replica로 만든 페이지는 캐시하지 않음
+        client.get('/boards?offset=0&limit=4')
+        client.get('/boards?offset=0&limit=4')
+        self.assertEqual(list_cache_stats.stats()["hits"], 0)
+
+        #primary로 고정된 요청이 만든 페이지는 캐시
+        client.cookies["pin_primary"] = "1"
+        client.get('/boards?offset=0&limit=4')
+        client.get('/boards?offset=0&limit=4')
+        self.assertEqual(list_cache_stats.stats()["hits"], 1)
+
+    @override_settings(REPLICA_PIN_SECONDS = 0)
+    @patch("boards.cache.ReplicaAlias", return_value = "replica")
+    def test_BoardListView_get_replica_page_cached_after_pin_window(self, replica_alias):
+        client = Client()
+        list_cache_stats.clear()
+
+        client.get('/boards?offset=0&limit=4')
+        client.get('/boards?offset=0&limit=4')
+        self.assertEqual(list_cache_stats.stats()["hits"], 1)
+
+    def test_BoardListView_get_cache_invalidated_on_write(self):
+        client = Client()
+        client.get('/boards?offset=0&limit=4')
+
+        Board.objects.create(
+            writer  = User.objects.get(nickname = "orange"),
+            title   = "21번째 게시글",
+            content = "내용을 입력해 주세요."
+        )
+        response = client.get('/boards?offset=0&limit=4')
+
+        self.assertEqual(response.json()["RESULT"][0]["title"], "21번째 게시글")
+
+    def test_BoardListView_get_not_modified(self):
+        client   = Client()
+        response = client.get('/boards?offset=0&limit=4')
+        etag     = response["ETag"]
+
+        response = client.get('/boards?offset=0&limit=4', HTTP_IF_NONE_MATCH = etag)
+        self.assertEqual(response.status_code, 304)
+
+        response = client.get('/boards?offset=0&limit=4', HTTP_IF_MODIFIED_SINCE = response["Last-Modified"])
+        self.assertEqual(response.status_code, 304)
+
+        Board.objects.filter(id = 20).delete()
+        Board.objects.get(id = 19).delete()
+
+        response = client.get('/boards?offset=0&limit=4', HTTP_IF_NONE_MATCH = etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_BoardView_get_not_modified(self):
+        client   = Client()
+        response = client.get('/boards/1')
+        etag     = response["ETag"]
+
+        with self.assertNumQueries(1):
+            response = client.get('/boards/1', HTTP_IF_NONE_MATCH = etag)
+
+        self.assertEqual(response.status_code, 304)
+
+        board       = Board.objects.get(id = 1)
+        board.title = "수정된 1번째 게시글"
+        board.save()
+
+        response = client.get('/boards/1', HTTP_IF_NONE_MATCH = etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
     def test_BoardView_get_success(self):
         client   = Client()
         response = client.get('/boards/1')
@@ -130,6 +519,49 @@ class BoardReadTest(TestCase):
         })
         self.assertEqual(response.status_code, 200)
 
+    def test_BoardView_get_fields(self):
+        client = Client()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get('/boards/1?fields=title,writer')
+
+        self.assertEqual(response.json(), { "RESULT" : { "title" : "1번째 게시글", "writer" : "orange" } })
+        self.assertIn("ETag", response)
+        self.assertFalse([query for query in queries if '"content"' in query["sql"]])
+
+    def test_BoardBatchView_get_success(self):
+        client = Client()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get('/boards/batch?ids=3,100,1&fields=id,title')
+
+        self.assertEqual(response.json(), {
+            "RESULT" : [
+                { "id" : 3, "title" : "3번째 게시글" },
+                { "id" : 100, "MESSAGE" : "BOARD DOES NOT EXIST" },
+                { "id" : 1, "title" : "1번째 게시글" },
+            ]
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len([query for query in queries if '"boards"' in query["sql"]]), 1)
+
+    @override_settings(BOARD_BATCH_MAX_IDS = 2)
+    def test_BoardBatchView_get_too_many_items(self):
+        client   = Client()
+        response = client.get('/boards/batch?ids=1,2,3')
+
+        self.assertEqual(response.json(), { "MESSAGE" : "TOO MANY ITEMS" })
+        self.assertEqual(response.status_code, 413)
+
+    def test_BoardBatchView_get_input_error(self):
+        client = Client()
+
+        for query in ["", "?ids=", "?ids=1,a"]:
+            response = client.get(f'/boards/batch{query}')
+
+            self.assertEqual(response.json(), { "MESSAGE" : "INPUT ERROR" })
+            self.assertEqual(response.status_code, 400)
+
     def test_BoardView_get_board_does_not_exist(self):
         client   = Client()
         response = client.get('/boards/100')
@@ -139,6 +571,217 @@ class BoardReadTest(TestCase):
         })
         self.assertEqual(response.status_code, 400)
 
+class BoardExportTest(TestCase):
+    def setUp(self):
+        user = User.objects.create(
+            nickname = "orange",
+            password = "pass1234!@"
+        )
+
+        Board.objects.bulk_create(
+            [
+                Board(
+                    writer          = user,
+                    writer_nickname = user.nickname,
+                    title           = f"{i}번째 게시글",
+                    content         = "내용을 입력해 주세요."
+                ) for i in range(1, 8)
+            ]
+        )
+
+    def tearDown(self):
+        User.objects.all().delete()
+        Board.objects.all().delete()
+
+    @override_settings(BOARD_EXPORT_BATCH_SIZE = 3)
+    def test_BoardExportView_get_success(self):
+        client   = Client()
+        response = client.get('/boards/export')
+        lines    = b"".join(response.streaming_content).decode("utf-8").splitlines()
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual([json.loads(line)["id"] for line in lines], list(range(1, 8)))
+        self.assertEqual(json.loads(lines[0])["writer"], "orange")
+
+    def test_BoardExportView_get_since(self):
+        client = Client()
+        Board.objects.filter(id__in = [2, 5]).update(updated_at = datetime(2030, 1, 1))
+
+        response = client.get('/boards/export?since=2029-12-31T00:00:00')
+        lines    = b"".join(response.streaming_content).decode("utf-8").splitlines()
+
+        self.assertEqual([json.loads(line)["id"] for line in lines], [2, 5])
+
+    def test_BoardExportView_get_since_with_offset(self):
+        client = Client()
+        Board.objects.filter(id = 2).update(updated_at = datetime(2030, 1, 1, 0, 0))
+        Board.objects.filter(id = 5).update(updated_at = datetime(2030, 1, 1, 1, 0))
+
+        #2029-12-31 15:30 UTC는 TIME_ZONE(Asia/Seoul) 기준 2030-01-01 00:30
+        response = client.get('/boards/export', { "since" : "2029-12-31T15:30:00+00:00" })
+        lines    = b"".join(response.streaming_content).decode("utf-8").splitlines()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([json.loads(line)["id"] for line in lines], [5])
+
+    def test_BoardExportView_get_gzip(self):
+        client   = Client()
+        response = client.get('/boards/export', HTTP_ACCEPT_ENCODING = "gzip")
+        body     = gzip.decompress(b"".join(response.streaming_content)).decode("utf-8")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(len(body.splitlines()), 7)
+
+    def test_BoardExportView_get_input_error(self):
+        client   = Client()
+        response = client.get('/boards/export?since=yesterday')
+
+        self.assertEqual(response.json(), { "MESSAGE" : "INPUT ERROR" })
+        self.assertEqual(response.status_code, 400)
+
+class BoardSearchTest(TestCase):
+    def setUp(self):
+        user = User.objects.create(
+            nickname = "orange",
+            password = "pass1234!@"
+        )
+
+        Board.objects.bulk_create(
+            [
+                Board(
+                    writer          = user,
+                    writer_nickname = user.nickname,
+                    title           = f"{i}번째 게시글",
+                    content         = "검색 엔진 테스트" if i % 2 else "내용을 입력해 주세요."
+                ) for i in range(1, 11)
+            ]
+        )
+
+    def tearDown(self):
+        User.objects.all().delete()
+        Board.objects.all().delete()
+
+    def test_BoardSearchView_get_success(self):
+        client   = Client()
+        response = client.get('/boards/search?q=검색')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["RESULT"]), 4)
+        self.assertEqual(response.json()["RESULT"][0]["writer"], "orange")
+
+    def test_BoardSearchView_get_cursor(self):
+        client = Client()
+        ids    = []
+        cursor = ""
+
+        while cursor is not None:
+            response = client.get(f'/boards/search?q=검색&limit=2&cursor={cursor}').json()
+            ids     += [board["id"] for board in response["RESULT"]]
+            cursor   = response["NEXT"]
+
+        self.assertEqual(sorted(ids), [1, 3, 5, 7, 9])
+
+    def test_BoardSearchView_get_index_synced(self):
+        client = Client()
+
+        Board.objects.filter(id = 1).update(content = "변경된 내용")
+        Board.objects.filter(id = 3).delete()
+
+        response = client.get('/boards/search?q=검색&limit=10')
+        self.assertEqual(sorted(board["id"] for board in response.json()["RESULT"]), [5, 7, 9])
+
+    def test_BoardSearchView_get_special_characters(self):
+        client   = Client()
+        response = client.get('/boards/search?q="검색 OR*')
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_rebuild_search_index_command(self):
+        client = Client()
+        out    = StringIO()
+
+        call_command("rebuild_search_index", stdout = out)
+
+        response = client.get('/boards/search?q=검색&limit=10')
+        self.assertEqual(len(response.json()["RESULT"]), 5)
+        self.assertIn("SEARCH INDEX REBUILT", out.getvalue())
+
+    def test_search_triggers_exist(self):
+        #boards 테이블을 다시 만드는 migration이 trigger 복구를 빠뜨리면 실패
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'boards' ORDER BY name")
+            triggers = [row[0] for row in cursor.fetchall()]
+
+        self.assertEqual(triggers, ["boards_fts_delete", "boards_fts_insert", "boards_fts_update"])
+
+    def test_BoardSearchView_get_input_error(self):
+        client   = Client()
+        response = client.get('/boards/search?q=')
+
+        self.assertEqual(response.json(), { "MESSAGE" : "INPUT ERROR" })
+        self.assertEqual(response.status_code, 400)
+
+class BoardCountTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+        user_1 = User.objects.create(nickname = "orange", password = "pass1234!@")
+        user_2 = User.objects.create(nickname = "apple", password = "pass1234!@")
+
+        Board.objects.bulk_create([Board(writer = user_1, title = f"{i}번째 게시글", content = "내용") for i in range(1, 4)])
+        ReconcileBoardCount()
+
+        self.header1 = { "HTTP_Authorization" : jwt.encode({ "id" : user_1.id }, SECRET_KEY, algorithm = "HS256") }
+        self.header2 = { "HTTP_Authorization" : jwt.encode({ "id" : user_2.id }, SECRET_KEY, algorithm = "HS256") }
+
+    def test_BoardListView_get_total(self):
+        client = Client()
+
+        response = client.get('/boards?limit=1&total=true')
+        self.assertEqual(response.json()["TOTAL"], 3)
+        self.assertNotIn("TOTAL", client.get('/boards?limit=1').json())
+
+        with self.assertNumQueries(0):
+            client.get('/boards?limit=1&total=true')
+
+    def test_BoardListView_get_total_write_paths(self):
+        client = Client()
+        body   = json.dumps({ "title" : "제목", "content" : "내용" })
+
+        client.post('/boards/write', body, content_type = "application/json", **self.header1)
+        self.assertEqual(client.get('/boards?total=true').json()["TOTAL"], 4)
+
+        client.post('/boards/bulk', json.dumps([{ "title" : "제목", "content" : "내용" }] * 3), content_type = "application/json", **self.header1)
+        self.assertEqual(client.get('/boards?total=true').json()["TOTAL"], 7)
+
+        client.delete('/boards/1', **self.header2)
+        client.delete('/boards/100', **self.header1)
+        self.assertEqual(client.get('/boards?total=true').json()["TOTAL"], 7)
+
+        client.delete('/boards/1', **self.header1)
+        self.assertEqual(client.get('/boards?total=true').json()["TOTAL"], 6)
+        self.assertEqual(Board.objects.count(), 6)
+
+    def test_BoardListView_get_total_writer_input_error(self):
+        client   = Client()
+        response = client.get('/boards?writer=orange&total=true')
+
+        self.assertEqual(response.json(), { "MESSAGE" : "INPUT ERROR" })
+        self.assertEqual(response.status_code, 400)
+
+    def test_reconcile_board_count_command(self):
+        client = Client()
+        client.get('/boards?total=true')
+
+        Board.objects.filter(id = 1).delete()
+
+        output = StringIO()
+        call_command("reconcile_board_count", stdout = output)
+
+        self.assertIn("3 -> 2", output.getvalue())
+        self.assertEqual(GetBoardCount(), 2)
+        self.assertEqual(client.get('/boards?total=true').json()["TOTAL"], 2)
+
 class BoardUpdateAndDeleteTest(TestCase):
     def setUp(self):
         user_1 = User.objects.create(
@@ -176,6 +819,68 @@ class BoardUpdateAndDeleteTest(TestCase):
             "MESSAGE" : "UPDATED"
         })
         self.assertEqual(response.status_code, 201)
+        self.assertEqual(Board.objects.values("preview", "content_length").get(id = 1), {
+            "preview"        : "수정된 내용을 입력해 주세요.",
+            "content_length" : 16
+        })
+
+    def test_BoardView_patch_single_statement(self):
+        client     = Client()
+        header     = { "HTTP_Authorization" : self.token1 }
+        board_data = { "title" : "수정된 1번째 게시글", "content" : "수정된 내용을 입력해 주세요." }
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.patch('/boards/1', json.dumps(board_data), content_type = "application/json", **header)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len([query for query in queries if '"boards"' in query["sql"]]), 1)
+        self.assertEqual(client.get('/boards/1').json()["RESULT"]["title"], "수정된 1번째 게시글")
+
+    def test_BoardView_patch_if_match(self):
+        client     = Client()
+        header     = { "HTTP_Authorization" : self.token1 }
+        board_data = { "title" : "수정된 1번째 게시글", "content" : "수정된 내용을 입력해 주세요." }
+        etag       = client.get('/boards/1')["ETag"]
+
+        response = client.patch('/boards/1', json.dumps(board_data), content_type = "application/json", HTTP_IF_MATCH = etag, **header)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response["ETag"], client.get('/boards/1')["ETag"])
+
+        response = client.patch('/boards/1', json.dumps(board_data), content_type = "application/json", HTTP_IF_MATCH = etag, **header)
+        self.assertEqual(response.json(), { "MESSAGE" : "PRECONDITION FAILED" })
+        self.assertEqual(response.status_code, 412)
+
+    def test_BoardView_delete_if_match(self):
+        client = Client()
+        header = { "HTTP_Authorization" : self.token1 }
+
+        response = client.delete('/boards/1', HTTP_IF_MATCH = '"1-20000101000000000000"', **header)
+        self.assertEqual(response.status_code, 412)
+        self.assertTrue(Board.objects.filter(id = 1).exists())
+
+        response = client.delete('/boards/1', HTTP_IF_MATCH = client.get('/boards/1')["ETag"], **header)
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(Board.objects.filter(id = 1).exists())
+
+    def test_BoardView_delete_single_statement(self):
+        client = Client()
+        header = { "HTTP_Authorization" : self.token1 }
+        count  = GetBoardCount()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.delete('/boards/1', **header)
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual([query["sql"].split()[0] for query in queries if '"boards"' in query["sql"]], ["DELETE"])
+        self.assertEqual(GetBoardCount(), count - 1)
+
+    def test_BoardView_delete_invalidates_list_cache(self):
+        client = Client()
+        header = { "HTTP_Authorization" : self.token1 }
+
+        self.assertEqual(len(client.get('/boards').json()["RESULT"]), 1)
+        client.delete('/boards/1', **header)
+        self.assertEqual(client.get('/boards').json()["RESULT"], [])
 
     def test_BoardView_patch_forbidden(self):
         client     = Client()
@@ -216,6 +921,19 @@ class BoardUpdateAndDeleteTest(TestCase):
         })
         self.assertEqual(response.status_code, 400)
 
+    def test_BoardView_patch_invalid_content(self):
+        client     = Client()
+        header     = { "HTTP_Authorization" : self.token1 }
+        board_data = {
+            "title"   : "수정된 1번째 게시글",
+            "content" : 123
+        }
+        response = client.patch('/boards/1', json.dumps(board_data), content_type = "application/json", **header)
+        self.assertEqual(response.json(), {
+            "MESSAGE" : "INVALID CONTENTS"
+        })
+        self.assertEqual(response.status_code, 400)
+
     def test_BoardView_patch_key_error(self):
         client     = Client()
         header     = { "HTTP_Authorization" : self.token1 }
@@ -267,4 +985,149 @@ class BoardUpdateAndDeleteTest(TestCase):
         self.assertEqual(response.json(), {
             "MESSAGE" : "BOARD DOES NOT EXIST"
         })
-        self.assertEqual(response.status_code, 400)
\ No newline at end of file
+        self.assertEqual(response.status_code, 400)
+
+class AsyncBoardViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+        user_1 = User.objects.create(
+            nickname = "orange",
+            password = "pass1234!@"
+        )
+
+        user_2 = User.objects.create(
+            nickname = "strawberry",
+            password = "star1234!@"
+        )
+
+        Board.objects.create(
+            writer  = user_1,
+            title   = "1번째 게시글",
+            content = "내용을 입력해 주세요."
+        )
+
+        self.token1 = jwt.encode({ "id" : user_1.id }, SECRET_KEY, algorithm = "HS256")
+        self.token2 = jwt.encode({ "id" : user_2.id }, SECRET_KEY, algorithm = "HS256")
+
+    def tearDown(self):
+        User.objects.all().delete()
+        Board.objects.all().delete()
+
+    async def test_AsyncBoardListView_get_success(self):
+        client   = AsyncClient()
+        response = await client.get('/async/boards?offset=0&limit=4')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["RESULT"][0]["title"], "1번째 게시글")
+
+    async def test_AsyncBoardListView_get_paginate_cursor(self):
+        client   = AsyncClient()
+        response = await client.get('/async/boards?paginate=cursor&limit=1')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("NEXT", response.json())
+
+    async def test_AsyncBoardView_get_success(self):
+        client   = AsyncClient()
+        response = await client.get('/async/boards/1')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["RESULT"]["writer"], "orange")
+
+    async def test_AsyncBoardPostingView_post_success(self):
+        client     = AsyncClient()
+        board_data = {
+            "title"   : "게시판 등록",
+            "content" : "내용을 입력해 주세요."
+        }
+        response = await client.post(
+            '/async/boards/write',
+            json.dumps(board_data),
+            content_type       = "application/json",
+            authorization      = self.token1
+        )
+        self.assertEqual(response.json(), { "MESSAGE" : "CREATED" })
+        self.assertEqual(response.status_code, 201)
+
+    async def test_AsyncBoardPostingView_post_invalid_content(self):
+        client   = AsyncClient()
+        response = await client.post(
+            '/async/boards/write',
+            json.dumps({ "title" : "게시판 등록", "content" : 123 }),
+            content_type  = "application/json",
+            authorization = self.token1
+        )
+        self.assertEqual(response.json(), { "MESSAGE" : "INVALID CONTENTS" })
+        self.assertEqual(response.status_code, 400)
+
+    async def test_AsyncView_options(self):
+        client   = AsyncClient()
+        response = await client.options('/async/boards')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("GET", response["Allow"])
+
+        response = await client.put('/async/boards')
+        self.assertEqual(response.status_code, 405)
+
+    async def test_AsyncBoardPostingView_post_no_token(self):
+        client   = AsyncClient()
+        response = await client.post('/async/boards/write', "{}", content_type = "application/json")
+
+        self.assertEqual(response.json(), { "MESSAGE" : "NO TOKEN" })
+        self.assertEqual(response.status_code, 403)
+
+    async def test_AsyncBoardView_delete_forbidden(self):
+        client   = AsyncClient()
+        response = await client.delete('/async/boards/1', authorization = self.token2)
+
+        self.assertEqual(response.json(), { "MESSAGE" : "FORBIDDEN" })
+        self.assertEqual(response.status_code, 403)
+
+    async def test_AsyncBoardView_patch_success(self):
+        client     = AsyncClient()
+        board_data = {
+            "title"   : "수정된 1번째 게시글",
+            "content" : "수정된 내용을 입력해 주세요."
+        }
+        response = await client.patch(
+            '/async/boards/1',
+            json.dumps(board_data),
+            content_type       = "application/json",
+            authorization      = self.token1
+        )
+        self.assertEqual(response.json(), { "MESSAGE" : "UPDATED" })
+        self.assertEqual(response.status_code, 201)
+
+    async def test_AsyncBoardListView_get_not_modified(self):
+        client   = AsyncClient()
+        response = await client.get('/async/boards?offset=0&limit=4&fields=id,title')
+
+        self.assertEqual(response.json()["RESULT"], [{ "id" : 1, "title" : "1번째 게시글" }])
+
+        response = await client.get('/async/boards?offset=0&limit=4&fields=id,title', if_none_match = response["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+    async def test_AsyncBoardView_get_does_not_exist(self):
+        client   = AsyncClient()
+        response = await client.get('/async/boards/100')
+
+        self.assertEqual(response.json(), { "MESSAGE" : "BOARD DOES NOT EXIST" })
+        self.assertEqual(response.status_code, 400)
+
+    async def test_AsyncBoardView_patch_if_match(self):
+        client     = AsyncClient()
+        board_data = json.dumps({ "title" : "수정된 1번째 게시글", "content" : "수정된 내용을 입력해 주세요." })
+
+        response = await client.patch(
+            '/async/boards/1', board_data, content_type = "application/json", authorization = self.token1, if_match = '"1-20000101000000000000"'
+        )
+        self.assertEqual(response.json(), { "MESSAGE" : "PRECONDITION FAILED" })
+        self.assertEqual(response.status_code, 412)
+
+    async def test_AsyncBoardView_delete_success(self):
+        client   = AsyncClient()
+        response = await client.delete('/async/boards/1', authorization = self.token1)
+
+        self.assertEqual(response.status_code, 204)
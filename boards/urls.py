@@ -1,9 +1,13 @@
 from django.urls import path
 
-from boards.views import BoardListView, BoardPostingView, BoardView
+from boards.views import BoardBatchView, BoardBulkPostingView, BoardExportView, BoardListView, BoardPostingView, BoardSearchView, BoardView
 
 urlpatterns = [
     path("/write", BoardPostingView.as_view()),
+    path("/bulk", BoardBulkPostingView.as_view()),
+    path("/search", BoardSearchView.as_view()),
+    path("/export", BoardExportView.as_view()),
+    path("/batch", BoardBatchView.as_view()),
     path("", BoardListView.as_view()),
     path("/<int:board_id>", BoardView.as_view())
 ]
\ No newline at end of file
@@ -1,14 +1,289 @@
 import json
 
+from collections import namedtuple
+from datetime    import datetime
+
 from rest_framework.views import APIView
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
-from django.http  import JsonResponse, HttpResponse
+from django.conf                  import settings
+from django.db                    import IntegrityError, connections, router, transaction
+from django.http                  import HttpResponse, StreamingHttpResponse
+from django.db.models             import Q, Subquery
+from django.utils                 import timezone
+from django.utils.decorators      import method_decorator
+from django.views.decorators.gzip import gzip_page
+
+from boards.cache       import GetListPage, GetListVersion, GetListModified, BumpListVersion
+from boards.conditional import BoardETag, ListETag, HasConditionalHeaders, IfMatchTimes, NotModified, SetValidators
+from boards.counter     import AddBoardCount, GetBoardCount
+from boards.export      import ExportBoards
+from boards.models      import Board
+from boards.preview     import PreviewFields
+from boards.search      import SearchBoards
+from users.models       import User
+from core.auth          import authentication
+from core.pagination    import EncodeCursor, DecodeCursor, DecodeRankCursor
+from core.response      import JsonResponse, FormatDateTime
+from .serializers       import BoardSerializer
+
+class EmptyContents(Exception):
+    pass
+
+class InvalidContents(Exception):
+    pass
+
+def VerifyBoardInput(data):
+    title   = data["title"]
+    content = data["content"]
+
+    #숫자, 배열 등은 preview를 만들거나 저장하기 전에 거부
+    if not isinstance(title, str) or not isinstance(content, str):
+        raise InvalidContents
+
+    if title=="" or content=="":
+        raise EmptyContents
+
+    return title, content
+
+def ParseBulkBody(request):
+    #Content-Type이 NDJSON이면 한 줄에 게시글 하나, 아니면 JSON 배열
+    if request.content_type == "application/x-ndjson":
+        return [json.loads(line) for line in request.body.decode("utf-8").splitlines() if line.strip()]
+
+    items = json.loads(request.body)
+
+    if not isinstance(items, list):
+        raise ValueError
+
+    return items
+
+#fields= 이름 : (DB 컬럼, 응답 key)
+BOARD_FIELDS = {
+    "id"             : ("id", "id"),
+    "title"          : ("title", "title"),
+    "writer"         : ("writer_nickname", "writer"),
+    "updated_time"   : ("updated_at", "updated time"),
+    "content"        : ("content", "content"),
+    "preview"        : ("preview", "preview"),
+    "content_length" : ("content_length", "content length"),
+}
+
+#목록은 요청하지 않는 한 content를 읽지 않음
+LIST_FIELDS   = ("updated_time", "id", "writer", "title")
+DETAIL_FIELDS = ("content", "id", "title", "updated_time", "writer")
+
+def ParseFields(value, default):
+    #"id,title"처럼 쉼표로 구분, 알 수 없는 이름은 ValueError
+    if value is None:
+        return default
+
+    fields = tuple(dict.fromkeys(name.strip() for name in value.split(",") if name.strip()))
+
+    if not fields or any(name not in BOARD_FIELDS for name in fields):
+        raise ValueError
+
+    return fields
+
+def FieldColumns(fields, required = ()):
+    #요청된 컬럼과 pagination, validator에 필요한 컬럼만 .values()로 조회
+    return tuple(dict.fromkeys(list(required) + [BOARD_FIELDS[name][0] for name in fields]))
+
+def BoardItem(row, fields):
+    item = {}
+
+    for name in fields:
+        column, key = BOARD_FIELDS[name]
+        item[key]   = FormatDateTime(row[column]) if column == "updated_at" else row[column]
+
+    return item
+
+def BoardListQuerySet(fields, writer_id = None):
+    #기본 fields는 boards_list_covering_idx에 포함된 컬럼뿐이므로 인덱스만으로 조회
+    #작성자별 목록은 boards_writer_updated_id_idx로 정렬 없이 조회
+    boards = Board.objects.order_by("-updated_at", "-id").values(*FieldColumns(fields, ("updated_at", "id")))
+
+    return boards if writer_id is None else boards.filter(writer_id = writer_id)
+
+def WriterParams(request):
+    #writer_id=는 user id, writer=는 닉네임 ("12345" 같은 닉네임도 닉네임으로 조회), 둘 다 주면 INPUT ERROR
+    WRITER_ID = request.GET.get("writer_id")
+    WRITER    = request.GET.get("writer")
+
+    if WRITER_ID and WRITER:
+        raise ValueError
+
+    return (int(WRITER_ID) if WRITER_ID else None), WRITER
+
+def ResolveWriter(nickname):
+    #없는 닉네임은 어떤 게시글과도 일치하지 않는 id 0
+    return User.objects.filter(nickname = nickname).values_list("id", flat = True).first() or 0
+
+def BoardListOffsetPage(limit, offset, fields = LIST_FIELDS, writer_id = None):
+    boards = BoardListQuerySet(fields, writer_id)[offset : offset + limit]
+
+    return { "RESULT" : [BoardItem(board, fields) for board in boards] }
+
+def BoardListCursorPage(limit, cursor_position, fields = LIST_FIELDS, writer_id = None):
+    boards = BoardListQuerySet(fields, writer_id)
+
+    if cursor_position:
+        updated_at, board_id = cursor_position
+        boards = boards.filter(
+            Q(updated_at__lt = updated_at) | Q(updated_at = updated_at, id__lt = board_id)
+        )
+
+    boards      = list(boards[:limit + 1])
+    next_cursor = None
+
+    if len(boards) > limit:
+        boards      = boards[:limit]
+        next_cursor = EncodeCursor(boards[-1]["updated_at"], boards[-1]["id"]) if boards else None
+
+    return {
+        "RESULT" : [BoardItem(board, fields) for board in boards],
+        "NEXT"   : next_cursor
+    }
+
+ListQuery = namedtuple("ListQuery", ["limit", "offset", "cursor", "cursor_position", "fields", "total", "writer_id", "key_parts"])
+
+def ParseListQuery(request, writer_id):
+    LIMIT  = int(request.GET.get("limit", 4))
+    OFFSET = int(request.GET.get("offset", 0))
+    CURSOR   = request.GET.get("cursor")
+    PAGINATE = request.GET.get("paginate", "cursor" if CURSOR is not None else "offset")
+    FIELDS   = ParseFields(request.GET.get("fields"), LIST_FIELDS)
+    TOTAL    = request.GET.get("total") == "true"
+
+    #전체 개수만 유지하므로 작성자별 목록의 total은 지원하지 않음
+    if LIMIT < 0 or OFFSET < 0 or (TOTAL and writer_id is not None) or PAGINATE not in ("offset", "cursor"):
+        raise ValueError
+
+    #paginate=cursor는 첫 페이지, 이후 페이지는 응답의 NEXT를 cursor=로 전달 (cursor=만 줘도 cursor 방식)
+    if PAGINATE == "cursor":
+        CURSOR = CURSOR or ""
+    elif CURSOR is not None:
+        raise ValueError
+
+    cursor_position = DecodeCursor(CURSOR) if CURSOR else None
+    key_parts       = ("offset", LIMIT, OFFSET) if CURSOR is None else ("cursor", LIMIT, CURSOR)
+    key_parts      += (",".join(FIELDS), writer_id, TOTAL)
+
+    return ListQuery(LIMIT, OFFSET, CURSOR, cursor_position, FIELDS, TOTAL, writer_id, key_parts)
+
+def ListValidators(query):
+    #목록 version과 Last-Modified (cache, DB 조회)
+    version = GetListVersion()
+
+    return version, ListETag(version, query.key_parts), GetListModified(version)
+
+def ListPage(version, query):
+    def build():
+        if query.cursor is None:
+            page = BoardListOffsetPage(query.limit, query.offset, query.fields, query.writer_id)
+        else:
+            page = BoardListCursorPage(query.limit, query.cursor_position, query.fields, query.writer_id)
+
+        #작성, 삭제마다 목록 version이 바뀌므로 TOTAL도 페이지와 함께 캐시
+        if query.total:
+            page["TOTAL"] = GetBoardCount()
+
+        return page
 
-from boards.models import Board
-from core.auth     import authentication
-from .serializers  import BoardSerializer
+    return GetListPage(version, query.key_parts, build)
+
+def BoardUpdatedAt(board_id):
+    return Board.objects.filter(id = board_id).values_list("updated_at", flat = True).first()
+
+def BoardRow(board_id, fields):
+    return Board.objects.filter(id = board_id).values(*FieldColumns(fields, ("updated_at",))).first()
+
+def WriterNickname(user_id):
+    #request.user의 닉네임은 토큰 claims나 인증 캐시에서 온 값일 수 있으므로 INSERT 시점에 users 테이블에서 복사
+    return Subquery(User.objects.filter(id = user_id).values("nickname")[:1])
+
+def CreateBoard(user, title, content):
+    with transaction.atomic():
+        Board.objects.create(
+            writer_id       = user.id,
+            writer_nickname = WriterNickname(user.id),
+            title           = title,
+            content         = content,
+            **PreviewFields(content)
+        )
+        AddBoardCount(1)
+
+    #post_save의 목록 캐시 무효화는 commit 전에 실행되므로 commit 후 한 번 더 무효화
+    BumpListVersion()
+
+def OwnedBoard(user_id, board_id, times):
+    #작성자 본인의 게시글만, If-Match가 있으면 해당 버전일 때만 대상이 되는 queryset
+    boards = Board.objects.filter(id = board_id, writer_id = user_id)
+
+    return boards if times is None else boards.filter(updated_at__in = times)
+
+def UpdateBoard(user_id, board_id, times, title, content):
+    #수정된 행이 없으면 None
+    updated_at = timezone.now()
+
+    #update()는 auto_now와 signal을 적용하지 않으므로 updated_at과 목록 캐시를 직접 갱신
+    updated = OwnedBoard(user_id, board_id, times).update(
+        title      = title,
+        content    = content,
+        updated_at = updated_at,
+        **PreviewFields(content)
+    )
+
+    if not updated:
+        return None
+
+    BumpListVersion()
+
+    return updated_at
+
+def DeleteBoard(user_id, board_id, times):
+    #QuerySet.delete()는 post_delete receiver 때문에 행을 먼저 SELECT하므로 DELETE 한 번을 직접 실행
+    #signal을 보내지 않는 대신 전체 개수와 목록 캐시는 여기서 갱신하고, 검색 인덱스는 FTS trigger가 정리
+    if times == []:
+        return 0
+
+    connection = connections[router.db_for_write(Board)]
+    sql        = f"DELETE FROM {connection.ops.quote_name(Board._meta.db_table)} WHERE id = %s AND writer_id = %s"
+    params     = [board_id, user_id]
+
+    if times is not None:
+        sql    += f" AND updated_at IN ({', '.join(['%s'] * len(times))})"
+        params += [connection.ops.adapt_datetimefield_value(time) for time in times]
+
+    with transaction.atomic(using = connection.alias):
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            deleted = cursor.rowcount
+
+        AddBoardCount(-deleted)
+
+    if deleted:
+        BumpListVersion()
+
+    return deleted
+
+def WriteFailure(user_id, board_id):
+    #수정, 삭제된 행이 없을 때만 작성자를 한 번 더 조회해 실패 원인을 구분, (MESSAGE, status) 반환
+    writer_id = Board.objects.filter(id = board_id).values_list("writer_id", flat = True).first()
+
+    if writer_id is None:
+        return "BOARD DOES NOT EXIST", 400
+
+    if writer_id != user_id:
+        return "FORBIDDEN", 403
+
+    return "PRECONDITION FAILED", 412
+
+def BoardWriteFailed(user_id, board_id):
+    message, status = WriteFailure(user_id, board_id)
+
+    return JsonResponse({ "MESSAGE" : message }, status = status)
 
 class BoardPostingView(APIView):
     """
@@ -32,51 +307,219 @@ class BoardPostingView(APIView):
         try:
             data = json.loads(request.body)
 
-            title   = data["title"]
-            content = data["content"]
+            title, content = VerifyBoardInput(data)
 
-            if title=="" or content=="":
-                return JsonResponse({ "MESSAGE" : "PLEASE INPUT CONTENTS" }, status = 400)
-
-            Board.objects.create(
-                writer  = request.user,
-                title   = title,
-                content = content
-            )
+            CreateBoard(request.user, title, content)
 
             return JsonResponse({ "MESSAGE" : "CREATED" }, status = 201)
 
+        except IntegrityError:
+            #claims 토큰은 만료 전까지 삭제된 유저도 통과하므로 INSERT에서 작성자가 없으면 거부
+            return JsonResponse({ "MESSAGE" : "INVALID USER" }, status = 403)
+
         except KeyError:
             return JsonResponse({ "MESSAGE" : "KEY ERROR" }, status = 400)
 
+        except EmptyContents:
+            return JsonResponse({ "MESSAGE" : "PLEASE INPUT CONTENTS" }, status = 400)
+
+        except InvalidContents:
+            return JsonResponse({ "MESSAGE" : "INVALID CONTENTS" }, status = 400)
+
+class BoardBulkPostingView(APIView):
+    """
+    # 게시글 일괄 작성 (JSON 배열 또는 NDJSON)
+    """
+
+    parameter_token = openapi.Parameter (
+                                        "Authorization", 
+                                        openapi.IN_HEADER, 
+                                        description = "access_token", 
+                                        type        = openapi.TYPE_STRING
+    )
+    @swagger_auto_schema(
+        manual_parameters = [parameter_token]
+    )
+    @authentication
+    def post(self, request):
+        try:
+            items = ParseBulkBody(request)
+
+            if len(items) > getattr(settings, "BOARD_BULK_MAX_ITEMS", 10000):
+                return JsonResponse({ "MESSAGE" : "TOO MANY ITEMS" }, status = 413)
+
+            boards   = []
+            errors   = []
+            nickname = WriterNickname(request.user.id)
+
+            for index, data in enumerate(items):
+                try:
+                    if not isinstance(data, dict):
+                        raise KeyError
+
+                    title, content = VerifyBoardInput(data)
+                    boards.append(Board(
+                        writer_id       = request.user.id,
+                        writer_nickname = nickname,
+                        title           = title,
+                        content         = content,
+                        **PreviewFields(content)
+                    ))
+
+                except KeyError:
+                    errors.append({ "index" : index, "MESSAGE" : "KEY ERROR" })
+
+                except EmptyContents:
+                    errors.append({ "index" : index, "MESSAGE" : "PLEASE INPUT CONTENTS" })
+
+                except InvalidContents:
+                    errors.append({ "index" : index, "MESSAGE" : "INVALID CONTENTS" })
+
+            if not boards:
+                return JsonResponse({ "MESSAGE" : "NOTHING CREATED", "ERRORS" : errors }, status = 400)
+
+            try:
+                with transaction.atomic():
+                    Board.objects.bulk_create(boards, batch_size = getattr(settings, "BOARD_BULK_BATCH_SIZE", 500))
+                    AddBoardCount(len(boards))
+
+            except IntegrityError:
+                return JsonResponse({ "MESSAGE" : "INVALID USER" }, status = 403)
+
+            #bulk_create는 post_save signal을 보내지 않으므로 목록 캐시를 직접 무효화
+            BumpListVersion()
+
+            return JsonResponse({
+                "MESSAGE" : "CREATED",
+                "CREATED" : len(boards),
+                "ERRORS"  : errors
+            }, status = 201)
+
+        except ValueError:
+            return JsonResponse({ "MESSAGE" : "INPUT ERROR" }, status = 400)
+
 class BoardListView(APIView):
     """
-    # 게시글 전체 조회
+    # 게시글 전체 조회 (writer=<닉네임> 또는 writer_id=<user id>로 작성자별 조회)
+    # 기본은 offset=&limit= 방식, paginate=cursor로 요청하면 응답의 NEXT를 cursor=로 넘겨 다음 페이지 조회
+    """
+
+    def get(self, request):
+        try:
+            writer_id, nickname = WriterParams(request)
+
+            if nickname:
+                writer_id = ResolveWriter(nickname)
+
+            return self.list(request, writer_id)
+
+        except ValueError:
+            return JsonResponse({ "MESSAGE" : "INPUT ERROR" }, status = 400)
+
+    def list(self, request, writer_id):
+        try:
+            query = ParseListQuery(request, writer_id)
+
+            version, etag, last_modified = ListValidators(query)
+
+            not_modified = NotModified(request, etag, last_modified)
+            if not_modified is not None:
+                return not_modified
+
+            return SetValidators(JsonResponse(ListPage(version, query), status = 200), etag, last_modified)
+
+        except ValueError:
+            return JsonResponse({ "MESSAGE" : "INPUT ERROR" }, status = 400)
+
+class UserBoardListView(BoardListView):
+    """
+    # 작성자별 게시글 조회
+    """
+
+    def get(self, request, user_id):
+        return self.list(request, user_id)
+
+class BoardSearchView(APIView):
+    """
+    # 게시글 검색
     """
 
     def get(self, request):
         try:
+            QUERY  = request.GET.get("q", "").strip()
             LIMIT  = int(request.GET.get("limit", 4))
-            OFFSET = int(request.GET.get("offset", 0))
-            
-            if LIMIT < 0 or OFFSET < 0:
+            CURSOR = request.GET.get("cursor")
+
+            if not QUERY or LIMIT < 0:
                 raise ValueError
 
-            boards = Board.objects.select_related('writer').order_by("-updated_at")[OFFSET : OFFSET + LIMIT]
+            cursor_position = DecodeRankCursor(CURSOR) if CURSOR else None
+
+            return JsonResponse(SearchBoards(QUERY, LIMIT, cursor_position), status = 200)
+
+        except ValueError:
+            return JsonResponse({ "MESSAGE" : "INPUT ERROR" }, status = 400)
+
+class BoardBatchView(APIView):
+    """
+    # 게시글 여러 개 상세 조회
+    """
+
+    def get(self, request):
+        try:
+            IDS    = [int(board_id) for board_id in request.GET.get("ids", "").split(",") if board_id.strip()]
+            FIELDS = ParseFields(request.GET.get("fields"), DETAIL_FIELDS)
+
+            if not IDS:
+                raise ValueError
+
+            if len(IDS) > getattr(settings, "BOARD_BATCH_MAX_IDS", 100):
+                return JsonResponse({ "MESSAGE" : "TOO MANY ITEMS" }, status = 413)
+
+            #한 번의 id IN 조회 결과를 요청한 순서대로 배치, 없는 id는 표시만 남김
+            boards = {
+                board["id"] : board for board in Board.objects.filter(id__in = set(IDS)).values(*FieldColumns(FIELDS, ("id",)))
+            }
 
             return JsonResponse({
                 "RESULT" : [
-                    {
-                        "updated time" : board.updated_at.strftime("%Y-%m-%d %H:%M:%S"),
-                        "id"           : board.id,
-                        "writer"       : board.writer.nickname,
-                        "title"        : board.title,
-                    } for board in boards]
+                    BoardItem(boards[board_id], FIELDS) if board_id in boards else { "id" : board_id, "MESSAGE" : "BOARD DOES NOT EXIST" }
+                    for board_id in IDS
+                ]
             }, status = 200)
 
         except ValueError:
             return JsonResponse({ "MESSAGE" : "INPUT ERROR" }, status = 400)
 
+def ParseSince(value):
+    #offset이 있는 값은 updated_at과 같은 기준(USE_TZ=False면 TIME_ZONE의 naive)으로 바꿈
+    #스트리밍이 시작된 뒤 ORM에서 실패하지 않도록 응답을 만들기 전에 변환
+    since = datetime.fromisoformat(value)
+
+    if settings.USE_TZ and timezone.is_naive(since):
+        return timezone.make_aware(since)
+
+    if not settings.USE_TZ and timezone.is_aware(since):
+        return timezone.make_naive(since)
+
+    return since
+
+class BoardExportView(APIView):
+    """
+    # 게시글 전체 내보내기 (NDJSON 스트리밍)
+    """
+
+    @method_decorator(gzip_page)
+    def get(self, request):
+        try:
+            SINCE = request.GET.get("since")
+            since = ParseSince(SINCE) if SINCE else None
+
+            return StreamingHttpResponse(ExportBoards(since), content_type = "application/x-ndjson", status = 200)
+
+        except ValueError:
+            return JsonResponse({ "MESSAGE" : "INPUT ERROR" }, status = 400)
+
 class BoardView(APIView):
     """
     # 게시글 CRUD
@@ -84,21 +527,33 @@ class BoardView(APIView):
 
     def get(self, request, board_id):
         try:
-            board = Board.objects.select_related('writer').get(id = board_id)
+            FIELDS = ParseFields(request.GET.get("fields"), DETAIL_FIELDS)
+
+            if HasConditionalHeaders(request):
+                updated_at = BoardUpdatedAt(board_id)
+
+                if updated_at is None:
+                    raise Board.DoesNotExist
+
+                not_modified = NotModified(request, BoardETag(board_id, updated_at), updated_at.timestamp())
+                if not_modified is not None:
+                    return not_modified
+
+            board = BoardRow(board_id, FIELDS)
+
+            if board is None:
+                raise Board.DoesNotExist
             
-            return JsonResponse({
-                "RESULT" : {
-                    "content"      : board.content,
-                    "id"           : board.id,
-                    "title"        : board.title,
-                    "updated time" : board.updated_at.strftime("%Y-%m-%d %H:%M:%S"),
-                    "writer"       : board.writer.nickname,
-                }
-            }, status = 200)
+            response = JsonResponse({ "RESULT" : BoardItem(board, FIELDS) }, status = 200)
+
+            return SetValidators(response, BoardETag(board_id, board["updated_at"]), board["updated_at"].timestamp())
 
         except Board.DoesNotExist:
             return JsonResponse({ "MESSAGE" : "BOARD DOES NOT EXIST" }, status = 400)
 
+        except ValueError:
+            return JsonResponse({ "MESSAGE" : "INPUT ERROR" }, status = 400)
+
     """
     # 게시글 수정
     """
@@ -118,28 +573,25 @@ class BoardView(APIView):
         try:
             data = json.loads(request.body)
             
-            title   = data["title"]
-            content = data["content"]
-
-            board = Board.objects.get(id = board_id)
+            title, content = VerifyBoardInput(data)
 
-            if board.writer.id != request.user.id:
-                return JsonResponse({ "MESSAGE" : "FORBIDDEN" }, status = 403)
+            updated_at = UpdateBoard(request.user.id, board_id, IfMatchTimes(request, board_id), title, content)
 
-            if title=="" or content=="":
-                return JsonResponse({ "MESSAGE" : "PLEASE INPUT CONTENTS" }, status = 400)
+            if updated_at is None:
+                return BoardWriteFailed(request.user.id, board_id)
 
-            board.title   = title
-            board.content = content
-            board.save()
+            response = JsonResponse({ "MESSAGE" : "UPDATED" }, status = 201)
 
-            return JsonResponse({ "MESSAGE" : "UPDATED" }, status = 201)
+            return SetValidators(response, BoardETag(board_id, updated_at), updated_at.timestamp())
 
         except KeyError:
             return JsonResponse({ "MESSAGE" : "KEY ERROR" }, status = 400)
-        
-        except Board.DoesNotExist:
-            return JsonResponse({ "MESSAGE" : "BOARD DOES NOT EXIST"}, status = 400)
+
+        except EmptyContents:
+            return JsonResponse({ "MESSAGE" : "PLEASE INPUT CONTENTS" }, status = 400)
+
+        except InvalidContents:
+            return JsonResponse({ "MESSAGE" : "INVALID CONTENTS" }, status = 400)
 
     """
     # 게시글 삭제
@@ -157,16 +609,7 @@ class BoardView(APIView):
     )
     @authentication
     def delete(self, request, board_id):
-        try:
-            board = Board.objects.get(id = board_id)
-
-            if board.writer.id != request.user.id:
-                return JsonResponse({ "MESSAGE" : "FORBIDDEN" }, status = 403)
-
-            board.delete()
-
-            return HttpResponse(status = 204)
-
-        except Board.DoesNotExist:
-            return JsonResponse({ "MESSAGE" : "BOARD DOES NOT EXIST"}, status = 400)
+        if not DeleteBoard(request.user.id, board_id, IfMatchTimes(request, board_id)):
+            return BoardWriteFailed(request.user.id, board_id)
 
+        return HttpResponse(status = 204)
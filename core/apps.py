@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        #유저 캐시 무효화, SQLite 연결 설정, 요청별 쿼리 측정 signal 등록
+        from core import auth, db, middleware
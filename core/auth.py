@@ -1,24 +1,151 @@
-from jwt import exceptions, decode
+import asyncio, threading
 
-from django.http import JsonResponse
+from collections import OrderedDict
+from datetime    import datetime, timedelta
+from functools   import wraps
+from time        import monotonic
 
-from my_settings  import SECRET_KEY
-from users.models import User
+from asgiref.sync import sync_to_async
+
+from jwt import exceptions, decode, encode
+
+from django.conf               import settings
+from django.db.models.signals  import post_save, post_delete
+from django.dispatch           import receiver
+
+from core.metrics  import RegisterMetrics
+from core.response import JsonResponse
+from my_settings   import SECRET_KEY
+from users.models  import User
+
+class PrincipalCache:
+    """
+    # 인증된 유저 객체를 user id 기준으로 보관하는 LRU + TTL 캐시
+    """
+
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl      = ttl
+        self.entries  = OrderedDict()
+        self.lock     = threading.Lock()
+        self.hits     = 0
+        self.misses   = 0
+
+    def get(self, user_id):
+        with self.lock:
+            entry = self.entries.get(user_id)
+
+            if entry is not None and entry[1] > monotonic():
+                self.entries.move_to_end(user_id)
+                self.hits += 1
+                return entry[0]
+
+            if entry is not None:
+                del self.entries[user_id]
+
+            self.misses += 1
+            return None
+
+    def set(self, user_id, user):
+        if self.max_size <= 0:
+            return
+
+        with self.lock:
+            self.entries[user_id] = (user, monotonic() + self.ttl)
+            self.entries.move_to_end(user_id)
+
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last = False)
+
+    def invalidate(self, user_id):
+        with self.lock:
+            self.entries.pop(user_id, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits   = 0
+            self.misses = 0
+
+    def stats(self):
+        with self.lock:
+            return {
+                "hits"   : self.hits,
+                "misses" : self.misses,
+                "size"   : len(self.entries),
+            }
+
+user_cache = PrincipalCache(
+    max_size = getattr(settings, "AUTH_USER_CACHE_SIZE", 1024),
+    ttl      = getattr(settings, "AUTH_USER_CACHE_TTL", 60),
+)
+RegisterMetrics("principal_cache", user_cache.stats)
+
+class TokenPrincipal:
+    """
+    # claims 모드에서 DB 조회 없이 토큰의 claim으로 만든 유저 정보
+    """
+
+    def __init__(self, id, nickname):
+        self.id       = id
+        self.nickname = nickname
+
+def IsClaimsMode():
+    return getattr(settings, "AUTH_MODE", "database") == "claims"
+
+def CreateAccessToken(user):
+    if not IsClaimsMode():
+        return encode({ "id" : user.id }, SECRET_KEY, algorithm = "HS256")
+
+    now = datetime.utcnow()
+
+    return encode({
+        "id"       : user.id,
+        "nickname" : user.nickname,
+        "iat"      : now,
+        "exp"      : now + timedelta(seconds = getattr(settings, "AUTH_TOKEN_LIFETIME", 3600)),
+    }, SECRET_KEY, algorithm = "HS256")
+
+@receiver([post_save, post_delete], sender = User)
+def invalidate_user_cache(sender, instance, **kwargs):
+    user_cache.invalidate(instance.id)
+
+def DecodeAccessToken(access_token):
+    if IsClaimsMode():
+        return decode(
+            access_token,
+            SECRET_KEY,
+            algorithms = "HS256",
+            options    = { "require" : ["id", "nickname", "iat", "exp"] }
+        )
+
+    return decode(access_token, SECRET_KEY, algorithms = "HS256")
+
+def LoadUser(user_id):
+    user = User.objects.get(id = user_id)
+    user_cache.set(user_id, user)
+
+    return user
 
 def authentication(func):
+    if asyncio.iscoroutinefunction(func):
+        return async_authentication(func)
+
+    @wraps(func)
     def wrapper(self, request, *args, **kwargs):
         try:
             access_token = request.headers.get('Authorization')
             if not access_token:
                 return JsonResponse( {'MESSAGE' : 'NO TOKEN'}, status = 403)
 
-            payload = decode(access_token, SECRET_KEY, algorithms = "HS256")
-            user_id = payload["id"]
+            payload = DecodeAccessToken(access_token)
 
-            user = User.objects.get(id = user_id)
-            request.user = user
+            if IsClaimsMode():
+                request.user = TokenPrincipal(payload["id"], payload["nickname"])
+            else:
+                request.user = user_cache.get(payload["id"]) or LoadUser(payload["id"])
 
-        except exceptions.DecodeError:
+        except exceptions.InvalidTokenError:
             return JsonResponse( {'MESSAGE' : 'INVALID TOKEN'}, status = 403)
 
         except User.DoesNotExist:
@@ -27,4 +154,29 @@ def authentication(func):
         return func(self, request, *args, **kwargs)
 
     return wrapper
-    
\ No newline at end of file
+
+def async_authentication(func):
+    #토큰 검증과 캐시 조회는 event loop에서, 캐시 miss일 때만 DB 조회를 thread로 넘김
+    @wraps(func)
+    async def wrapper(self, request, *args, **kwargs):
+        try:
+            access_token = request.headers.get('Authorization')
+            if not access_token:
+                return JsonResponse( {'MESSAGE' : 'NO TOKEN'}, status = 403)
+
+            payload = DecodeAccessToken(access_token)
+
+            if IsClaimsMode():
+                request.user = TokenPrincipal(payload["id"], payload["nickname"])
+            else:
+                request.user = user_cache.get(payload["id"]) or await sync_to_async(LoadUser)(payload["id"])
+
+        except exceptions.InvalidTokenError:
+            return JsonResponse( {'MESSAGE' : 'INVALID TOKEN'}, status = 403)
+
+        except User.DoesNotExist:
+            return JsonResponse( {'MESSAGE' : 'INVALID USER'}, status = 403)
+
+        return await func(self, request, *args, **kwargs)
+
+    return wrapper
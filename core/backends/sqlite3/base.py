@@ -0,0 +1,25 @@
+from django.core.exceptions     import ImproperlyConfigured
+from django.db.backends.sqlite3 import base
+
+TRANSACTION_MODES = ("DEFERRED", "IMMEDIATE", "EXCLUSIVE")
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    # OPTIONS["transaction_mode"]로 atomic()이 여는 transaction의 BEGIN 종류를 지정하는 SQLite backend (Django 5.1의 같은 옵션)
+    # FTS5 trigger는 쓰기 전에 읽기 snapshot을 잡으므로, DEFERRED로 시작한 쓰기 transaction은 그 사이 다른 연결이 commit하면
+    # busy_timeout을 기다리지 않고 바로 "database is locked"로 실패함, IMMEDIATE는 BEGIN에서 쓰기 lock을 기다림
+    """
+
+    def get_connection_params(self):
+        kwargs = super().get_connection_params()
+        mode   = kwargs.pop("transaction_mode", None)
+
+        if mode is not None and mode.upper() not in TRANSACTION_MODES:
+            raise ImproperlyConfigured(f"transaction_mode must be one of {', '.join(TRANSACTION_MODES)}")
+
+        return kwargs
+
+    def _start_transaction_under_autocommit(self):
+        mode = self.settings_dict["OPTIONS"].get("transaction_mode")
+
+        self.cursor().execute(f"BEGIN {mode.upper()}" if mode else "BEGIN")
@@ -0,0 +1,23 @@
+from django.conf                import settings
+from django.db.backends.signals import connection_created
+from django.dispatch            import receiver
+
+def ApplyPragmas(cursor, pragmas):
+    for name, value in pragmas.items():
+        cursor.execute(f"PRAGMA {name} = {value}")
+
+@receiver(connection_created)
+def configure_sqlite(sender, connection, **kwargs):
+    #새 SQLite 연결마다 WAL, synchronous, mmap, cache, busy timeout 설정 적용
+    if connection.vendor != "sqlite":
+        return
+
+    with connection.cursor() as cursor:
+        ApplyPragmas(cursor, getattr(settings, "SQLITE_PRAGMAS", {}))
+
+def CopyDatabase(source, target):
+    #sqlite3 backup API로 source 연결의 DB 전체를 target 연결의 DB에 복사 (target의 기존 내용은 덮어씀)
+    source.ensure_connection()
+    target.ensure_connection()
+
+    source.connection.backup(target.connection)
@@ -0,0 +1,185 @@
+import json, os, random, shutil, tempfile, threading, time
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib         import contextmanager
+
+from django.core.cache           import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.db                   import connection
+from django.test                 import Client
+from django.test.utils           import setup_databases, teardown_databases
+
+from boards.models import Board
+from core.auth     import CreateAccessToken
+from core.seed     import SeedBoards, SeedUsers
+from users.models  import User
+
+ENDPOINTS = ["list", "detail", "write", "sign-in", "sign-up"]
+PASSWORD  = "pass1234!@"
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+
+        return execute(sql, params, many, context)
+
+def Percentile(values, p):
+    if not values:
+        return 0.0
+
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+@contextmanager
+def BenchDatabase():
+    #SQLite 기본 테스트 DB(shared-cache 메모리 DB)는 테이블 단위 lock이라 동시 쓰기가 busy_timeout 없이
+    #"database table is locked"로 실패하므로 운영과 같이 WAL, busy_timeout이 적용되는 임시 파일 DB를 사용
+    test_settings = connection.settings_dict["TEST"]
+    test_name     = test_settings.get("NAME")
+    temp_dir      = tempfile.mkdtemp(prefix = "bench_endpoints") if connection.vendor == "sqlite" else None
+
+    if temp_dir:
+        test_settings["NAME"] = os.path.join(temp_dir, "bench.sqlite3")
+
+    try:
+        old_config = setup_databases(verbosity = 0, interactive = False, aliases = {"default"})
+
+        try:
+            yield
+
+        finally:
+            teardown_databases(old_config, verbosity = 0)
+
+    finally:
+        test_settings["NAME"] = test_name
+
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors = True)
+
+class Command(BaseCommand):
+    help = (
+        "임시 테스트 DB에 데이터를 생성한 뒤 각 endpoint를 WSGI app으로 동시에 호출하여 "
+        "처리량, p50/p95/p99 latency, 요청당 SQL 쿼리 수를 측정합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type = int, default = 1000)
+        parser.add_argument("--boards", type = int, default = 10000)
+        parser.add_argument("--requests", type = int, default = 500)
+        parser.add_argument("--concurrency", type = int, default = 8)
+        parser.add_argument("--endpoints", default = ",".join(ENDPOINTS))
+        parser.add_argument("--seed", type = int, default = 0)
+        parser.add_argument("--output", help = "결과를 저장할 JSON 파일 경로")
+
+    def handle(self, *args, **options):
+        endpoints = options["endpoints"].split(",")
+
+        for endpoint in endpoints:
+            if endpoint not in ENDPOINTS:
+                raise CommandError(f"UNKNOWN ENDPOINT : {endpoint}")
+
+        with BenchDatabase():
+            self.rng = random.Random(options["seed"])
+            self.seed(options["users"], options["boards"])
+
+            results = {
+                "settings" : {
+                    key : options[key] for key in ("users", "boards", "requests", "concurrency", "seed")
+                },
+                "endpoints" : {
+                    endpoint : self.run(endpoint, options["requests"], options["concurrency"])
+                    for endpoint in endpoints
+                },
+            }
+
+        self.report(results["endpoints"])
+
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                json.dump(results, output, indent = 2, sort_keys = True)
+
+    def seed(self, users, boards):
+        writers       = SeedUsers(users, PASSWORD, prefix = "bench", batch_size = 1000)
+        self.user_ids = [user_id for user_id, _ in writers]
+
+        SeedBoards(boards, writers, self.rng, batch_size = 1000)
+
+        self.board_ids = list(Board.objects.values_list("id", flat = True))
+        self.signups   = 0
+
+        for cache in caches.all():
+            cache.clear()
+
+    def build_request(self, endpoint):
+        if endpoint == "list":
+            return "get", f"/boards?offset={self.rng.randint(0, 5) * 20}&limit=20", {}
+
+        if endpoint == "detail":
+            return "get", f"/boards/{self.rng.choice(self.board_ids)}", {}
+
+        if endpoint == "write":
+            token = CreateAccessToken(User(id = self.rng.choice(self.user_ids), nickname = "bench"))
+            body  = json.dumps({ "title" : "벤치마크 게시글", "content" : "내용을 입력해 주세요." })
+
+            return "post", "/boards/write", { "data" : body, "content_type" : "application/json", "HTTP_AUTHORIZATION" : token }
+
+        if endpoint == "sign-in":
+            body = json.dumps({ "nickname" : f"bench{self.rng.randrange(len(self.user_ids))}", "password" : PASSWORD })
+
+            return "post", "/user/sign-in", { "data" : body, "content_type" : "application/json" }
+
+        self.signups += 1
+        body = json.dumps({ "nickname" : f"signup{self.signups}", "password" : PASSWORD })
+
+        return "post", "/user/sign-up", { "data" : body, "content_type" : "application/json" }
+
+    def run(self, endpoint, total, concurrency):
+        requests = [self.build_request(endpoint) for _ in range(total)]
+        local    = threading.local()
+
+        def send(request):
+            method, path, kwargs = request
+
+            if not hasattr(local, "client"):
+                local.client = Client()
+
+            counter = QueryCounter()
+            start   = time.perf_counter()
+
+            with connection.execute_wrapper(counter):
+                response = getattr(local.client, method)(path, **kwargs)
+
+            return time.perf_counter() - start, counter.count, response.status_code
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers = concurrency) as executor:
+            samples = list(executor.map(send, requests))
+        elapsed = time.perf_counter() - start
+
+        latencies = sorted(sample[0] for sample in samples)
+        statuses  = {}
+        for sample in samples:
+            statuses[str(sample[2])] = statuses.get(str(sample[2]), 0) + 1
+
+        return {
+            "requests"            : total,
+            "seconds"             : elapsed,
+            "throughput"          : total / elapsed,
+            "latency_p50_ms"      : Percentile(latencies, 0.50) * 1000,
+            "latency_p95_ms"      : Percentile(latencies, 0.95) * 1000,
+            "latency_p99_ms"      : Percentile(latencies, 0.99) * 1000,
+            "queries_per_request" : sum(sample[1] for sample in samples) / total,
+            "statuses"            : statuses,
+        }
+
+    def report(self, results):
+        self.stdout.write(f"{'endpoint':<10}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'queries':>10}  statuses")
+
+        for endpoint, result in results.items():
+            self.stdout.write(
+                f"{endpoint:<10}{result['throughput']:>10.1f}{result['latency_p50_ms']:>10.2f}"
+                f"{result['latency_p95_ms']:>10.2f}{result['latency_p99_ms']:>10.2f}"
+                f"{result['queries_per_request']:>10.2f}  {result['statuses']}"
+            )
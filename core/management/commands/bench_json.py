@@ -0,0 +1,59 @@
+import timeit
+
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand
+from django.http                 import JsonResponse as DjangoJsonResponse
+from django.test                 import override_settings
+
+from core.response import JsonResponse, FormatDateTime, orjson
+
+class Command(BaseCommand):
+    help = "게시글 목록 형태의 응답을 django JsonResponse와 core.response.JsonResponse로 직렬화하는 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type = int, default = 20)
+        parser.add_argument("--number", type = int, default = 2000)
+
+    def handle(self, *args, **options):
+        rows   = options["rows"]
+        number = options["number"]
+        now    = datetime.now()
+        times  = [now - timedelta(minutes = i) for i in range(rows)]
+
+        def baseline():
+            return DjangoJsonResponse({
+                "RESULT" : [
+                    {
+                        "updated time" : updated_at.strftime("%Y-%m-%d %H:%M:%S"),
+                        "id"           : i,
+                        "writer"       : "orange",
+                        "title"        : f"{i}번째 게시글",
+                    } for i, updated_at in enumerate(times)]
+            })
+
+        def fast():
+            return JsonResponse({
+                "RESULT" : [
+                    {
+                        "updated time" : FormatDateTime(updated_at),
+                        "id"           : i,
+                        "writer"       : "orange",
+                        "title"        : f"{i}번째 게시글",
+                    } for i, updated_at in enumerate(times)]
+            })
+
+        results = [("django JsonResponse", timeit.timeit(baseline, number = number))]
+
+        with override_settings(JSON_RESPONSE_BACKEND = "json"):
+            assert fast().content == baseline().content
+            results.append(("core JsonResponse (json)", timeit.timeit(fast, number = number)))
+
+        if orjson is not None:
+            with override_settings(JSON_RESPONSE_BACKEND = "orjson"):
+                results.append(("core JsonResponse (orjson)", timeit.timeit(fast, number = number)))
+
+        base = results[0][1]
+        self.stdout.write(f"{rows} rows x {number} responses")
+        for name, elapsed in results:
+            self.stdout.write(f"{name:<28}{elapsed * 1e6 / number:>10.1f} us/response{base / elapsed:>8.2f}x")
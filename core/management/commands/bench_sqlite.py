@@ -0,0 +1,110 @@
+import os, random, sqlite3, tempfile, threading, time
+
+from django.conf                 import settings
+from django.core.management.base import BaseCommand
+
+from core.db import ApplyPragmas
+
+SCHEMA = """
+    CREATE TABLE boards (
+        id         INTEGER PRIMARY KEY AUTOINCREMENT,
+        updated_at TEXT NOT NULL,
+        title      TEXT NOT NULL,
+        content    TEXT NOT NULL,
+        writer_id  INTEGER NOT NULL
+    )
+"""
+
+class Command(BaseCommand):
+    help = (
+        "기본 SQLite 설정(rollback journal, 요청마다 새 연결)과 SQLITE_PRAGMAS + 영속 연결 설정을 "
+        "읽기/쓰기가 섞인 동시 부하에서 비교합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type = int, default = 20000)
+        parser.add_argument("--threads", type = int, default = 8)
+        parser.add_argument("--seconds", type = float, default = 5.0)
+        parser.add_argument("--write-ratio", type = float, default = 0.1)
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'config':<10}{'reads/s':>12}{'writes/s':>12}{'locked':>10}")
+
+        for name, pragmas, persistent in (
+            ("default", {}, False),
+            ("tuned", getattr(settings, "SQLITE_PRAGMAS", {}), True),
+        ):
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, "bench.sqlite3")
+                self.seed(path, options["rows"])
+
+                reads, writes, locked = self.run(path, pragmas, persistent, options)
+
+            self.stdout.write(
+                f"{name:<10}{reads / options['seconds']:>12.1f}{writes / options['seconds']:>12.1f}{locked:>10}"
+            )
+
+    def seed(self, path, rows):
+        connection = sqlite3.connect(path)
+        connection.execute(SCHEMA)
+        connection.execute("CREATE INDEX boards_updated_id_idx ON boards (updated_at, id)")
+        connection.executemany(
+            "INSERT INTO boards (updated_at, title, content, writer_id) VALUES (?, ?, ?, ?)",
+            [(f"2021-10-22 20:{i % 60:02d}:{i % 59:02d}.{i:06d}", f"{i}번째 게시글", "내용" * 100, i % 100) for i in range(rows)]
+        )
+        connection.commit()
+        connection.close()
+
+    def run(self, path, pragmas, persistent, options):
+        deadline = time.perf_counter() + options["seconds"]
+        lock     = threading.Lock()
+        totals   = [0, 0, 0]
+
+        def connect():
+            connection = sqlite3.connect(path)
+            ApplyPragmas(connection.cursor(), pragmas)
+
+            return connection
+
+        def worker(seed):
+            rng        = random.Random(seed)
+            counts     = [0, 0, 0]
+            connection = connect() if persistent else None
+
+            while time.perf_counter() < deadline:
+                current = connection or connect()
+
+                try:
+                    if rng.random() < options["write_ratio"]:
+                        current.execute(
+                            "INSERT INTO boards (updated_at, title, content, writer_id) VALUES (datetime('now'), ?, ?, ?)",
+                            ("벤치마크 게시글", "내용" * 100, rng.randrange(100))
+                        )
+                        current.commit()
+                        counts[1] += 1
+                    else:
+                        current.execute("SELECT id, title, updated_at FROM boards ORDER BY updated_at DESC, id DESC LIMIT 20").fetchall()
+                        counts[0] += 1
+
+                except sqlite3.OperationalError:
+                    current.rollback()
+                    counts[2] += 1
+
+                finally:
+                    if not persistent:
+                        current.close()
+
+            if connection is not None:
+                connection.close()
+
+            with lock:
+                for i in range(3):
+                    totals[i] += counts[i]
+
+        threads = [threading.Thread(target = worker, args = (seed,)) for seed in range(options["threads"])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return totals
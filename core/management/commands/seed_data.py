@@ -0,0 +1,87 @@
+import random, time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db                   import IntegrityError, connection
+
+from boards.cache                      import BumpListVersion
+from boards.counter                    import AddBoardCount
+from boards.migrations._search_triggers import SEARCH_TRIGGERS
+from core.seed                         import SeedBoards, SeedUsers
+from users.models                      import User
+
+class Command(BaseCommand):
+    help = (
+        "부하 테스트용 유저와 게시글을 chunk 단위 bulk_create로 생성합니다. "
+        "같은 --seed와 개수를 주면 같은 데이터가 만들어집니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type = int, default = 1000, help = "0이면 기존 유저를 작성자로 사용")
+        parser.add_argument("--boards", type = int, default = 100000)
+        parser.add_argument("--seed", type = int, default = 0)
+        parser.add_argument("--batch-size", type = int, default = 5000)
+        parser.add_argument("--days", type = int, default = 365, help = "updated_at을 분포시킬 기간")
+        parser.add_argument("--content-length", type = int, default = 120, help = "content 길이 중앙값")
+        parser.add_argument("--prefix", default = "seed", help = "생성할 유저 닉네임 접두사")
+        parser.add_argument("--password", default = "pass1234!@")
+        parser.add_argument(
+            "--defer-search-index",
+            action = "store_true",
+            help   = "SQLite에서 FTS5 trigger를 끄고 넣은 뒤 검색 인덱스를 한 번에 다시 생성"
+        )
+
+    def handle(self, *args, **options):
+        rng          = random.Random(options["seed"])
+        started      = time.perf_counter()
+        self.started = started
+
+        try:
+            if options["users"]:
+                writers = SeedUsers(
+                    options["users"], options["password"], options["prefix"], options["batch_size"], self.progress
+                )
+            else:
+                writers = list(User.objects.order_by("id").values_list("id", "nickname"))
+
+        except IntegrityError:
+            raise CommandError(f"NICKNAME PREFIX ALREADY USED : {options['prefix']}")
+
+        if options["boards"] and not writers:
+            raise CommandError("NO USERS TO WRITE BOARDS")
+
+        defer_search = options["defer_search_index"] and connection.vendor == "sqlite"
+
+        if defer_search:
+            with connection.cursor() as cursor:
+                for name in ("boards_fts_insert", "boards_fts_delete", "boards_fts_update"):
+                    cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+        try:
+            self.started = time.perf_counter()
+            SeedBoards(
+                options["boards"], writers, rng, options["days"], options["content_length"], options["batch_size"], self.progress
+            )
+
+        finally:
+            if defer_search:
+                with connection.cursor() as cursor:
+                    for sql in SEARCH_TRIGGERS:
+                        cursor.execute(sql)
+
+                    cursor.execute("INSERT INTO boards_fts(boards_fts) VALUES ('rebuild')")
+
+        #bulk_create는 signal을 보내지 않으므로 전체 개수와 목록 캐시를 직접 갱신
+        AddBoardCount(options["boards"])
+        BumpListVersion()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"SEEDED {options['users']} USERS, {options['boards']} BOARDS IN {time.perf_counter() - started:.1f}s"
+        ))
+
+    def progress(self, name, done, total):
+        elapsed = time.perf_counter() - self.started
+        rate    = done / elapsed if elapsed else 0.0
+        ending  = "\n" if done >= total else ""
+
+        self.stdout.write(f"\r{name:<7}{done:>12,}/{total:,}  {done * 100 // total:>3}%  {rate:>10,.0f} rows/s", ending = ending)
+        self.stdout.flush()
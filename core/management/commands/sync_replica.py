@@ -0,0 +1,38 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db                   import DEFAULT_DB_ALIAS, connections
+
+from core.db     import CopyDatabase
+from core.router import ReplicaAlias
+
+class Command(BaseCommand):
+    help = (
+        "primary SQLite 파일을 replica 역할을 하는 두 번째 SQLite 파일로 복사합니다 (sqlite3 backup API). "
+        "replica는 migrate하지 않으므로 스키마와 데이터 모두 이 명령으로 채우며, --interval을 주면 주기적으로 복사해 복제 지연을 흉내냅니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--interval", type = float, default = 0, help = "0보다 크면 이 간격(초)마다 계속 복사")
+
+    def handle(self, *args, **options):
+        alias = ReplicaAlias()
+
+        if alias is None:
+            raise CommandError("REPLICA IS NOT A SEPARATE DATABASE")
+
+        if connections[alias].vendor != "sqlite" or connections[DEFAULT_DB_ALIAS].vendor != "sqlite":
+            raise CommandError("ONLY SQLITE DATABASES CAN BE COPIED")
+
+        while True:
+            started = time.perf_counter()
+            CopyDatabase(connections[DEFAULT_DB_ALIAS], connections[alias])
+
+            self.stdout.write(self.style.SUCCESS(
+                f"COPIED {DEFAULT_DB_ALIAS} TO {alias} IN {time.perf_counter() - started:.2f}s"
+            ))
+
+            if options["interval"] <= 0:
+                return
+
+            time.sleep(options["interval"])
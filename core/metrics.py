@@ -0,0 +1,38 @@
+import json, logging, os, threading
+
+from time import monotonic
+
+logger = logging.getLogger("wanted.metrics")
+
+#이름 -> stats() 함수, 각 모듈이 counter를 만들 때 등록
+metric_sources = {}
+
+def RegisterMetrics(name, source):
+    metric_sources[name] = source
+
+def CollectMetrics():
+    return { name : source() for name, source in metric_sources.items() }
+
+class MetricsLogger:
+    """
+    # 프로세스마다 따로 쌓이는 counter를 interval초에 한 번 pid와 함께 structured log로 남김
+    # 요청을 처리한 뒤 확인하므로 별도 thread가 없고, worker마다 자신의 값을 기록
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.lock     = threading.Lock()
+        self.last     = monotonic()
+
+    def maybe_log(self):
+        now = monotonic()
+
+        with self.lock:
+            if now - self.last < self.interval:
+                return False
+
+            self.last = now
+
+        logger.info(json.dumps({ "event" : "metrics", "pid" : os.getpid(), **CollectMetrics() }))
+
+        return True
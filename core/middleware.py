@@ -0,0 +1,300 @@
+import asyncio, cProfile, itertools, json, logging, os, pstats, re, threading
+
+from contextvars import ContextVar
+from time        import perf_counter, time
+
+from django.conf                import settings
+from django.core.exceptions     import MiddlewareNotUsed
+from django.db.backends.signals import connection_created
+from django.dispatch            import receiver
+from django.utils.decorators    import sync_and_async_middleware
+
+from core.metrics import MetricsLogger
+from core.router  import PinToPrimary, pinned_to_primary
+
+logger = logging.getLogger("wanted.requests")
+
+current_timing = ContextVar("current_timing", default = None)
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+class RequestTiming:
+    def __init__(self):
+        self.queries   = 0
+        self.db        = 0.0
+        self.view      = 0.0
+        self.serialize = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+
+        finally:
+            self.db      += perf_counter() - start
+            self.queries += 1
+
+def RecordSerialize(elapsed):
+    timing = current_timing.get()
+
+    if timing is not None:
+        timing.serialize += elapsed
+
+def RecordQuery(execute, sql, params, many, context):
+    #측정 중인 요청(current_timing)이 있을 때만 집계, sync_to_async thread도 context를 복사하므로 같은 요청으로 집계됨
+    timing = current_timing.get()
+
+    if timing is None:
+        return execute(sql, params, many, context)
+
+    return timing(execute, sql, params, many, context)
+
+@receiver(connection_created)
+def install_query_timing(sender, connection, **kwargs):
+    #쿼리를 실행하는 스레드의 연결마다 한 번 설치 (요청 스레드에서 execute_wrapper를 걸면 다른 스레드의 쿼리는 빠짐)
+    if RecordQuery not in connection.execute_wrappers:
+        connection.execute_wrappers.append(RecordQuery)
+
+@sync_and_async_middleware
+def RequestTimingMiddleware(get_response):
+    """
+    # 요청별 쿼리 수, DB 시간, view 시간, 직렬화 시간을 측정하여 Server-Timing 헤더로 반환
+    # view 시간(URL 처리 포함)을 재기 위해 MIDDLEWARE의 마지막(가장 안쪽)에 위치해야 함
+    # REQUEST_TIMING_ENABLED = False 이면 middleware 자체가 제외되고, 연결마다 설치된 RecordQuery만 남음
+    # StreamingHttpResponse(/boards/export)는 응답을 반환한 뒤 본문을 만들며 쿼리하므로 측정되지 않음
+    """
+
+    if not getattr(settings, "REQUEST_TIMING_ENABLED", False):
+        raise MiddlewareNotUsed
+
+    slow_ms = getattr(settings, "REQUEST_TIMING_SLOW_MS", 500)
+
+    def finish(request, response, timing, total):
+        #view 시간에는 view 안에서 일어난 직렬화 시간이 포함되므로 분리
+        timing.view = total - timing.serialize
+
+        response["Server-Timing"] = ", ".join([
+            f"db;dur={timing.db * 1000:.2f};desc=\"{timing.queries} queries\"",
+            f"view;dur={timing.view * 1000:.2f}",
+            f"serialize;dur={timing.serialize * 1000:.2f}",
+            f"app;dur={total * 1000:.2f}",
+        ])
+
+        if total * 1000 >= slow_ms:
+            logger.warning(json.dumps({
+                "event"        : "slow_request",
+                "method"       : request.method,
+                "path"         : request.path,
+                "status"       : response.status_code,
+                "duration_ms"  : round(total * 1000, 2),
+                "db_ms"        : round(timing.db * 1000, 2),
+                "queries"      : timing.queries,
+                "view_ms"      : round(timing.view * 1000, 2),
+                "serialize_ms" : round(timing.serialize * 1000, 2),
+            }))
+
+        return response
+
+    if asyncio.iscoroutinefunction(get_response):
+        async def middleware(request):
+            timing = RequestTiming()
+            token  = current_timing.set(timing)
+            start  = perf_counter()
+
+            try:
+                response = await get_response(request)
+
+            finally:
+                current_timing.reset(token)
+
+            return finish(request, response, timing, perf_counter() - start)
+
+    else:
+        def middleware(request):
+            timing = RequestTiming()
+            token  = current_timing.set(timing)
+            start  = perf_counter()
+
+            try:
+                response = get_response(request)
+
+            finally:
+                current_timing.reset(token)
+
+            return finish(request, response, timing, perf_counter() - start)
+
+    return middleware
+
+class ProfilingMiddleware:
+    """
+    # PROFILING_SAMPLE_RATE 요청마다 한 번, 또는 X-Profile 헤더가 PROFILING_TOKEN과 같은 요청을 cProfile로 측정
+    # URL pattern별로 통계를 모아 PROFILING_DUMP_EVERY 번마다 PROFILING_DIR에 .prof 파일로 저장
+    # pattern별로 최근 PROFILING_KEEP 개의 파일만 남기고 오래된 파일은 삭제
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "PROFILING_ENABLED", False):
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        self.sample_rate  = getattr(settings, "PROFILING_SAMPLE_RATE", 100)
+        self.token        = getattr(settings, "PROFILING_TOKEN", None)
+        self.directory    = getattr(settings, "PROFILING_DIR", "profiles")
+        self.dump_every   = getattr(settings, "PROFILING_DUMP_EVERY", 10)
+        self.keep         = getattr(settings, "PROFILING_KEEP", 5)
+        self.counter      = itertools.count(1)
+        self.lock         = threading.Lock()
+        self.aggregates   = {}
+
+        os.makedirs(self.directory, exist_ok = True)
+
+    def should_profile(self, request):
+        if self.token and request.headers.get("X-Profile") == self.token:
+            return True
+
+        return self.sample_rate > 0 and next(self.counter) % self.sample_rate == 0
+
+    def __call__(self, request):
+        if not self.should_profile(request):
+            return self.get_response(request)
+
+        profiler = cProfile.Profile()
+
+        try:
+            profiler.enable()
+        except ValueError:
+            #다른 thread에서 이미 profiler가 동작 중인 경우 (Python 3.12+)
+            return self.get_response(request)
+
+        try:
+            response = self.get_response(request)
+
+        finally:
+            profiler.disable()
+
+        self.record(RouteName(request), profiler)
+
+        return response
+
+    def record(self, route, profiler):
+        with self.lock:
+            samples, stats = self.aggregates.get(route, (0, None))
+
+            if stats is None:
+                stats = pstats.Stats(profiler)
+            else:
+                stats.add(profiler)
+
+            samples += 1
+
+            if samples < self.dump_every:
+                self.aggregates[route] = (samples, stats)
+                return
+
+            self.aggregates.pop(route, None)
+
+        self.dump(route, stats)
+
+    def dump(self, route, stats):
+        prefix = os.path.join(self.directory, route)
+        stats.dump_stats(f"{prefix}.{int(time() * 1000)}.prof")
+
+        dumps = sorted(
+            name for name in os.listdir(self.directory)
+            if name.startswith(f"{route}.") and name.endswith(".prof")
+        )
+        for name in dumps[:-self.keep]:
+            os.remove(os.path.join(self.directory, name))
+
+def RouteName(request):
+    #"boards/<int:board_id>" -> "boards_int_board_id"
+    match = getattr(request, "resolver_match", None)
+
+    if match is None or not match.route:
+        return "unresolved"
+
+    return re.sub(r"[^0-9A-Za-z]+", "_", match.route).strip("_") or "root"
+
+@sync_and_async_middleware
+def ReplicaPinningMiddleware(get_response):
+    """
+    # 쓰기 요청과, 최근 쓰기를 한 클라이언트(REPLICA_PIN_COOKIE 쿠키)의 요청은 모든 읽기를 primary로 보냄
+    # 쓰기가 성공하면 REPLICA_PIN_SECONDS 동안 유지되는 쿠키를 응답에 설정
+    # ASGI에서 sync 어댑터로 요청이 직렬화되지 않도록 sync, async 양쪽으로 동작
+    """
+
+    cookie  = getattr(settings, "REPLICA_PIN_COOKIE", "pin_primary")
+    seconds = getattr(settings, "REPLICA_PIN_SECONDS", 5)
+
+    def pin(request):
+        is_write = request.method not in SAFE_METHODS
+
+        if is_write or cookie in request.COOKIES:
+            PinToPrimary()
+
+        return is_write
+
+    def set_cookie(response, is_write):
+        if is_write and response.status_code < 400:
+            response.set_cookie(cookie, "1", max_age = seconds, httponly = True, samesite = "Lax")
+
+        return response
+
+    if asyncio.iscoroutinefunction(get_response):
+        async def middleware(request):
+            token = pinned_to_primary.set(False)
+
+            try:
+                is_write = pin(request)
+                response = await get_response(request)
+
+            finally:
+                pinned_to_primary.reset(token)
+
+            return set_cookie(response, is_write)
+
+    else:
+        def middleware(request):
+            token = pinned_to_primary.set(False)
+
+            try:
+                is_write = pin(request)
+                response = get_response(request)
+
+            finally:
+                pinned_to_primary.reset(token)
+
+            return set_cookie(response, is_write)
+
+    return middleware
+
+@sync_and_async_middleware
+def MetricsLogMiddleware(get_response):
+    """
+    # METRICS_LOG_INTERVAL초마다 core.metrics에 등록된 counter(비밀번호 pool, 인증 캐시, 목록 캐시 등)를 로그로 남김
+    # METRICS_LOG_INTERVAL이 0이면 middleware 자체가 제외됨
+    """
+
+    interval = getattr(settings, "METRICS_LOG_INTERVAL", 60)
+
+    if not interval:
+        raise MiddlewareNotUsed
+
+    metrics = MetricsLogger(interval)
+
+    if asyncio.iscoroutinefunction(get_response):
+        async def middleware(request):
+            response = await get_response(request)
+            metrics.maybe_log()
+
+            return response
+
+    else:
+        def middleware(request):
+            response = get_response(request)
+            metrics.maybe_log()
+
+            return response
+
+    return middleware
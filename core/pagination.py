@@ -0,0 +1,28 @@
+import base64
+
+from datetime import datetime
+
+def EncodeCursor(updated_at, id):
+    #(updated_at, id) 위치를 클라이언트가 해석할 수 없는 문자열로 변환
+    raw = f"{updated_at.isoformat()}|{id}".encode("utf-8")
+
+    return base64.urlsafe_b64encode(raw).decode("utf-8")
+
+def DecodeCursor(cursor):
+    #잘못된 cursor는 모두 ValueError로 처리
+    raw            = base64.urlsafe_b64decode(cursor.encode("utf-8")).decode("utf-8")
+    updated_at, id = raw.split("|")
+
+    return datetime.fromisoformat(updated_at), int(id)
+
+def EncodeRankCursor(rank, id):
+    #검색 결과의 (rank, id) 위치, float은 repr로 손실 없이 보관
+    raw = f"{rank!r}|{id}".encode("utf-8")
+
+    return base64.urlsafe_b64encode(raw).decode("utf-8")
+
+def DecodeRankCursor(cursor):
+    raw      = base64.urlsafe_b64decode(cursor.encode("utf-8")).decode("utf-8")
+    rank, id = raw.split("|")
+
+    return float(rank), int(id)
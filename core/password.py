@@ -0,0 +1,89 @@
+import bcrypt, threading
+
+from collections        import deque
+from concurrent.futures import ThreadPoolExecutor
+from time               import perf_counter
+
+from django.conf import settings
+
+from core.metrics import RegisterMetrics
+
+class PasswordPoolSaturated(Exception):
+    pass
+
+class PasswordPool:
+    """
+    # bcrypt 해시/검증 전용 thread pool (bcrypt는 계산 중 GIL을 놓으므로 thread로 충분)
+    # 대기 중인 작업이 max_queue를 넘으면 바로 PasswordPoolSaturated를 발생
+    """
+
+    def __init__(self, workers, max_queue):
+        self.workers   = workers
+        self.max_queue = max_queue
+        self.executor  = ThreadPoolExecutor(max_workers = workers, thread_name_prefix = "password")
+        self.lock      = threading.Lock()
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected  = 0
+        self.latencies = deque(maxlen = 1000)
+
+    def run(self, func, *args):
+        with self.lock:
+            if self.in_flight >= self.workers + self.max_queue:
+                self.rejected += 1
+                raise PasswordPoolSaturated
+
+            self.in_flight += 1
+
+        start = perf_counter()
+
+        try:
+            return self.executor.submit(func, *args).result()
+
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+                self.completed += 1
+                self.latencies.append(perf_counter() - start)
+
+    def stats(self):
+        with self.lock:
+            latencies = sorted(self.latencies)
+
+            def percentile(p):
+                return latencies[min(len(latencies) - 1, int(len(latencies) * p))] if latencies else 0.0
+
+            return {
+                "workers"     : self.workers,
+                "in_flight"   : self.in_flight,
+                "queue_depth" : max(0, self.in_flight - self.workers),
+                "completed"   : self.completed,
+                "rejected"    : self.rejected,
+                "latency_p50" : percentile(0.50),
+                "latency_p95" : percentile(0.95),
+                "latency_p99" : percentile(0.99),
+            }
+
+password_pool = PasswordPool(
+    workers   = getattr(settings, "PASSWORD_POOL_WORKERS", 4),
+    max_queue = getattr(settings, "PASSWORD_POOL_MAX_QUEUE", 32),
+)
+RegisterMetrics("password_pool", password_pool.stats)
+
+def GetRounds():
+    return getattr(settings, "BCRYPT_ROUNDS", 12)
+
+def HashPassword(password):
+    hashed_pw = password_pool.run(bcrypt.hashpw, password.encode("utf-8"), bcrypt.gensalt(GetRounds()))
+
+    return hashed_pw.decode("utf-8")
+
+def CheckPassword(password, hashed_pw):
+    return password_pool.run(bcrypt.checkpw, password.encode("utf-8"), hashed_pw.encode("utf-8"))
+
+def NeedsRehash(hashed_pw):
+    #bcrypt 해시 형식 : $2b$<cost>$<salt + hash>
+    try:
+        return int(hashed_pw.split("$")[2]) != GetRounds()
+    except (IndexError, ValueError):
+        return True
@@ -0,0 +1,47 @@
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db   import DEFAULT_DB_ALIAS, connections
+
+#True이면 현재 요청(context)의 읽기도 primary로 보냄 (read-your-writes)
+pinned_to_primary = ContextVar("pinned_to_primary", default = False)
+
+REPLICA_READ_MODELS = {"boards.board"}
+
+def PinToPrimary():
+    pinned_to_primary.set(True)
+
+def ReplicaAlias():
+    #replica가 설정되지 않았거나 primary와 같은 DB(로컬 개발, 테스트 mirror)를 가리키면 None
+    alias = getattr(settings, "DATABASE_REPLICA_ALIAS", None)
+
+    if not alias or alias not in connections:
+        return None
+
+    if connections[alias].settings_dict["NAME"] == connections[DEFAULT_DB_ALIAS].settings_dict["NAME"]:
+        return None
+
+    return alias
+
+class PrimaryReplicaRouter:
+    """
+    # 게시글 조회는 replica, 쓰기와 유저(인증) 조회는 primary로 보내는 router
+    """
+
+    def db_for_read(self, model, **hints):
+        if model._meta.label_lower not in REPLICA_READ_MODELS or pinned_to_primary.get():
+            return DEFAULT_DB_ALIAS
+
+        return ReplicaAlias() or DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        PinToPrimary()
+
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name = None, **hints):
+        #replica는 primary로부터 복제되므로 직접 migrate하지 않음 (로컬 SQLite replica는 sync_replica 명령으로 복사)
+        return db != getattr(settings, "DATABASE_REPLICA_ALIAS", None)
@@ -0,0 +1,108 @@
+import math, random
+
+from contextlib import contextmanager
+from datetime   import timedelta
+
+from django.db    import transaction
+from django.utils import timezone
+
+from boards.models  import Board
+from boards.preview import PreviewFields
+from core.password  import HashPassword
+from users.models   import User
+
+WORDS = [
+    "게시글", "내용", "오늘", "회사", "개발", "서버", "데이터", "질문", "답변", "후기",
+    "채용", "면접", "코드", "리뷰", "배포", "장애", "성능", "최적화", "테스트", "공유",
+    "django", "python", "sqlite", "index", "query", "cache", "async", "api", "json", "bench",
+]
+
+@contextmanager
+def ManualTimestamps(model):
+    #bulk_create도 auto_now 값을 현재 시각으로 덮어쓰므로 생성하는 동안만 비활성화
+    fields = [field for field in model._meta.concrete_fields if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)]
+    saved  = [(field, field.auto_now, field.auto_now_add) for field in fields]
+
+    for field in fields:
+        field.auto_now     = False
+        field.auto_now_add = False
+
+    try:
+        yield
+
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now     = auto_now
+            field.auto_now_add = auto_now_add
+
+def BuildCorpus(rng, size):
+    #게시글마다 단어를 고르지 않고 미리 만든 문자열에서 잘라 쓰기 위한 원문
+    words  = []
+    length = 0
+
+    while length < size:
+        word    = rng.choice(WORDS)
+        words.append(word)
+        length += len(word) + 1
+
+    return " ".join(words)
+
+def SeedUsers(count, password, prefix = "seed", batch_size = 5000, progress = None):
+    #bcrypt 해시는 한 번만 계산해서 모든 유저가 공유, 반환값은 (id, nickname) 목록
+    hashed_pw = HashPassword(password)
+    now       = timezone.now()
+    writers   = []
+
+    for start in range(0, count, batch_size):
+        nicknames = [f"{prefix}{i}" for i in range(start, min(count, start + batch_size))]
+
+        with transaction.atomic():
+            User.objects.bulk_create([
+                User(nickname = nickname, password = hashed_pw, created_at = now, updated_at = now) for nickname in nicknames
+            ])
+
+        #SQLite의 bulk_create는 id를 돌려주지 않으므로 unique 인덱스로 다시 조회
+        ids = dict(User.objects.filter(nickname__in = nicknames).values_list("nickname", "id"))
+        writers.extend((ids[nickname], nickname) for nickname in nicknames)
+
+        if progress:
+            progress("users", len(writers), count)
+
+    return writers
+
+def SeedBoards(count, writers, rng = None, days = 365, content_length = 120, batch_size = 5000, progress = None):
+    #작성자와 updated_at은 최근, 일부 유저에 몰리도록, content 길이는 중앙값이 content_length인 log-normal로 긴 글이 드물게 나오도록 생성
+    rng    = rng or random.Random(0)
+    corpus = BuildCorpus(rng, 40000)
+    now    = timezone.now()
+    span   = days * 24 * 60 * 60
+    mu     = math.log(content_length)
+
+    with ManualTimestamps(Board):
+        for start in range(0, count, batch_size):
+            boards = []
+
+            for i in range(start, min(count, start + batch_size)):
+                writer_id, nickname = writers[int(len(writers) * rng.random() ** 3)]
+
+                updated_at = now - timedelta(seconds = span * rng.random() ** 2)
+                created_at = updated_at if rng.random() < 0.8 else updated_at - timedelta(seconds = span * rng.random() / 10)
+                length     = max(1, min(len(corpus) // 2, int(rng.lognormvariate(mu, 1.0))))
+                offset     = rng.randrange(len(corpus) - length)
+                content    = corpus[offset : offset + length].strip() or "내용"
+
+                boards.append(Board(
+                    writer_id       = writer_id,
+                    writer_nickname = nickname,
+                    title           = f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i}",
+                    content         = content,
+                    created_at      = created_at,
+                    updated_at      = updated_at,
+                    **PreviewFields(content)
+                ))
+
+            with transaction.atomic():
+                Board.objects.bulk_create(boards)
+
+            if progress:
+                progress("boards", min(count, start + batch_size), count)
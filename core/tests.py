@@ -1,3 +1,606 @@
-from django.test import TestCase
+import asyncio, jwt, json, bcrypt, os, pstats, tempfile, time
 
-# Create your tests here.
+from asgiref.sync      import sync_to_async
+from concurrent.futures import ThreadPoolExecutor
+from datetime           import datetime, timedelta
+from io                 import StringIO
+from unittest.mock      import patch
+
+from django.core.management import CommandError, call_command
+from django.db              import DEFAULT_DB_ALIAS, connection, connections
+from django.http            import JsonResponse as DjangoJsonResponse
+from django.test            import SimpleTestCase, TestCase, Client, AsyncClient, override_settings
+from django.test.utils      import CaptureQueriesContext
+
+from boards.counter  import GetBoardCount
+from boards.models   import Board
+from boards.views    import CreateBoard
+from core.auth       import CreateAccessToken, PrincipalCache, user_cache
+from core.metrics    import MetricsLogger
+from core.middleware import ReplicaPinningMiddleware, RequestTiming, RequestTimingMiddleware, current_timing
+from core.response   import JsonResponse, FormatDateTime
+from core.router     import PrimaryReplicaRouter, ReplicaAlias, pinned_to_primary
+from users.models    import User
+from my_settings     import SECRET_KEY
+
+class PrincipalCacheTest(TestCase):
+    def test_PrincipalCache_hit_and_miss(self):
+        cache = PrincipalCache(max_size = 2, ttl = 60)
+
+        self.assertIsNone(cache.get(1))
+        cache.set(1, "orange")
+        self.assertEqual(cache.get(1), "orange")
+        self.assertEqual(cache.stats(), { "hits" : 1, "misses" : 1, "size" : 1 })
+
+    def test_PrincipalCache_evicts_least_recently_used(self):
+        cache = PrincipalCache(max_size = 2, ttl = 60)
+
+        cache.set(1, "orange")
+        cache.set(2, "strawberry")
+        cache.get(1)
+        cache.set(3, "banana")
+
+        self.assertEqual(cache.get(1), "orange")
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(cache.get(3), "banana")
+
+    def test_PrincipalCache_expired_entry(self):
+        cache = PrincipalCache(max_size = 2, ttl = 0)
+
+        cache.set(1, "orange")
+        self.assertIsNone(cache.get(1))
+        self.assertEqual(cache.stats()["size"], 0)
+
+class AuthenticationCacheTest(TestCase):
+    def setUp(self):
+        user_cache.clear()
+
+        self.user  = User.objects.create(
+            nickname = "orange",
+            password = "pass1234!@"
+        )
+        self.token = jwt.encode({ "id" : self.user.id }, SECRET_KEY, algorithm = "HS256")
+
+    def tearDown(self):
+        User.objects.all().delete()
+        user_cache.clear()
+
+    def test_authentication_reuses_cached_user(self):
+        client     = Client()
+        header     = { "HTTP_Authorization" : self.token }
+        board_data = {
+            "title"   : "게시판 등록",
+            "content" : "내용을 입력해 주세요."
+        }
+        client.post('/boards/write', json.dumps(board_data), content_type = "application/json", **header)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.post('/boards/write', json.dumps(board_data), content_type = "application/json", **header)
+
+        self.assertEqual(response.status_code, 201)
+        #게시글 INSERT의 닉네임 subquery를 제외한 인증용 유저 조회가 없어야 함
+        self.assertEqual([query for query in queries if query["sql"].startswith("SELECT") and '"users"' in query["sql"]], [])
+        self.assertEqual(user_cache.stats()["hits"], 1)
+
+    def test_authentication_cache_invalidated_on_delete(self):
+        client = Client()
+        header = { "HTTP_Authorization" : self.token }
+
+        client.delete('/boards/1', **header)
+        self.assertEqual(user_cache.stats()["size"], 1)
+
+        self.user.delete()
+        self.assertEqual(user_cache.stats()["size"], 0)
+
+        response = client.delete('/boards/1', **header)
+        self.assertEqual(response.json(), { "MESSAGE" : "INVALID USER" })
+        self.assertEqual(response.status_code, 403)
+
+@override_settings(AUTH_MODE = "claims")
+class ClaimsAuthenticationTest(TestCase):
+    def setUp(self):
+        hashed_pw = bcrypt.hashpw("pass1234!@".encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+        self.user = User.objects.create(
+            nickname = "orange",
+            password = hashed_pw
+        )
+
+    def tearDown(self):
+        User.objects.all().delete()
+
+    def test_claims_token_skips_user_lookup(self):
+        client   = Client()
+        sign_in  = {
+            "nickname" : "orange",
+            "password" : "pass1234!@"
+        }
+        response = client.post('/user/sign-in', json.dumps(sign_in), content_type = 'application/json')
+        token    = response.json()["TOKEN"]
+        payload  = jwt.decode(token, SECRET_KEY, algorithms = "HS256")
+
+        self.assertEqual(payload["id"], self.user.id)
+        self.assertEqual(payload["nickname"], "orange")
+        self.assertIn("exp", payload)
+
+        header     = { "HTTP_Authorization" : token }
+        board_data = {
+            "title"   : "게시판 등록",
+            "content" : "내용을 입력해 주세요."
+        }
+        with CaptureQueriesContext(connection) as queries:
+            response = client.post('/boards/write', json.dumps(board_data), content_type = "application/json", **header)
+
+        self.assertEqual(response.status_code, 201)
+        #게시글 INSERT의 닉네임 subquery를 제외한 인증용 유저 조회가 없어야 함
+        self.assertEqual([query for query in queries if query["sql"].startswith("SELECT") and '"users"' in query["sql"]], [])
+
+    def test_claims_token_without_expiry_rejected(self):
+        client = Client()
+        token  = jwt.encode({ "id" : self.user.id }, SECRET_KEY, algorithm = "HS256")
+
+        response = client.delete('/boards/1', HTTP_Authorization = token)
+        self.assertEqual(response.json(), { "MESSAGE" : "INVALID TOKEN" })
+        self.assertEqual(response.status_code, 403)
+
+    def test_claims_token_expired(self):
+        client = Client()
+        now    = datetime.utcnow()
+        token  = jwt.encode({
+            "id"       : self.user.id,
+            "nickname" : "orange",
+            "iat"      : now - timedelta(hours = 2),
+            "exp"      : now - timedelta(hours = 1),
+        }, SECRET_KEY, algorithm = "HS256")
+
+        response = client.delete('/boards/1', HTTP_Authorization = token)
+        self.assertEqual(response.json(), { "MESSAGE" : "INVALID TOKEN" })
+        self.assertEqual(response.status_code, 403)
+
+@override_settings(AUTH_MODE = "claims")
+class ClaimsDeletedUserTest(TestCase):
+    def setUp(self):
+        user       = User.objects.create(nickname = "orange", password = "pass1234!@")
+        self.token = CreateAccessToken(user)
+
+        #만료 전인 claims 토큰은 유저 조회 없이 통과
+        user.delete()
+
+    def test_write_with_deleted_user(self):
+        client     = Client()
+        header     = { "HTTP_Authorization" : self.token }
+        board_data = { "title" : "게시판 등록", "content" : "내용을 입력해 주세요." }
+
+        response = client.post('/boards/write', json.dumps(board_data), content_type = "application/json", **header)
+        self.assertEqual(response.json(), { "MESSAGE" : "INVALID USER" })
+        self.assertEqual(response.status_code, 403)
+
+        response = client.post('/boards/bulk', json.dumps([board_data]), content_type = "application/json", **header)
+        self.assertEqual(response.json(), { "MESSAGE" : "INVALID USER" })
+        self.assertEqual(response.status_code, 403)
+
+        self.assertFalse(Board.objects.exists())
+        self.assertEqual(GetBoardCount(), 0)
+
+    async def test_async_write_with_deleted_user(self):
+        client   = AsyncClient()
+        response = await client.post(
+            '/async/boards/write',
+            json.dumps({ "title" : "게시판 등록", "content" : "내용을 입력해 주세요." }),
+            content_type  = "application/json",
+            authorization = self.token
+        )
+        self.assertEqual(response.json(), { "MESSAGE" : "INVALID USER" })
+        self.assertEqual(response.status_code, 403)
+
+class JsonResponseTest(TestCase):
+    def setUp(self):
+        self.data = {
+            "RESULT" : [
+                {
+                    "updated time" : "2021-10-22 20:24:00",
+                    "id"           : 1,
+                    "writer"       : "orange",
+                    "title"        : "1번째 게시글",
+                }
+            ],
+            "NEXT" : None
+        }
+
+    def test_JsonResponse_default_byte_identical(self):
+        data = { "title" : "안녕", "RESULT" : self.data["RESULT"] }
+
+        self.assertEqual(JsonResponse(data).content, DjangoJsonResponse(data).content)
+
+    @override_settings(JSON_RESPONSE_BACKEND = "json")
+    def test_JsonResponse_json_byte_identical(self):
+        self.assertEqual(JsonResponse(self.data).content, DjangoJsonResponse(self.data).content)
+
+    @override_settings(JSON_RESPONSE_BACKEND = "orjson")
+    def test_JsonResponse_orjson_same_document(self):
+        response = JsonResponse(self.data, status = 201)
+
+        self.assertEqual(json.loads(response.content), json.loads(DjangoJsonResponse(self.data).content))
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(response.status_code, 201)
+
+    def test_JsonResponse_safe(self):
+        with self.assertRaises(TypeError):
+            JsonResponse([1, 2, 3])
+
+    def test_FormatDateTime(self):
+        value = datetime(2021, 10, 22, 20, 24, 5, 123456)
+
+        self.assertEqual(FormatDateTime(value), value.strftime("%Y-%m-%d %H:%M:%S"))
+
+class RequestTimingMiddlewareTest(TestCase):
+    def setUp(self):
+        user = User.objects.create(
+            nickname = "orange",
+            password = "pass1234!@"
+        )
+        Board.objects.create(
+            writer  = user,
+            title   = "1번째 게시글",
+            content = "내용을 입력해 주세요."
+        )
+
+    def tearDown(self):
+        User.objects.all().delete()
+        Board.objects.all().delete()
+
+    def test_timing_disabled(self):
+        client   = Client()
+        response = client.get('/boards/1')
+
+        self.assertNotIn("Server-Timing", response)
+
+    @override_settings(REQUEST_TIMING_ENABLED = True, REQUEST_TIMING_SLOW_MS = 60 * 1000)
+    def test_timing_server_timing_header(self):
+        client   = Client()
+        response = client.get('/boards/1')
+        metrics  = [metric.split(";")[0] for metric in response["Server-Timing"].split(", ")]
+
+        self.assertEqual(metrics, ["db", "view", "serialize", "app"])
+        self.assertIn('desc="1 queries"', response["Server-Timing"])
+
+    @override_settings(REQUEST_TIMING_ENABLED = True, REQUEST_TIMING_SLOW_MS = 60 * 1000)
+    async def test_timing_async_view_queries(self):
+        #async view의 쿼리는 sync_to_async thread에서 실행되어도 같은 요청으로 집계
+        client   = AsyncClient()
+        response = await client.get('/async/boards/1')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('desc="1 queries"', response["Server-Timing"])
+
+    async def test_timing_queries_in_other_thread(self):
+        #ASGI 서버처럼 요청 스레드가 아닌 스레드의 새 연결에서 실행된 쿼리도 집계
+        def query():
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+
+            finally:
+                connections.close_all()
+
+        timing = RequestTiming()
+        token  = current_timing.set(timing)
+
+        try:
+            await sync_to_async(query, thread_sensitive = False)()
+
+        finally:
+            current_timing.reset(token)
+
+        #새 연결의 PRAGMA도 이 요청의 쿼리로 집계됨
+        self.assertGreaterEqual(timing.queries, 1)
+
+    def test_timing_sync_and_async_capable(self):
+        self.assertTrue(RequestTimingMiddleware.sync_capable)
+        self.assertTrue(RequestTimingMiddleware.async_capable)
+
+    @override_settings(REQUEST_TIMING_ENABLED = True, REQUEST_TIMING_SLOW_MS = 0)
+    def test_timing_slow_request_log(self):
+        client = Client()
+
+        with self.assertLogs("wanted.requests", level = "WARNING") as logs:
+            client.get('/boards/1')
+
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record["event"], "slow_request")
+        self.assertEqual(record["path"], "/boards/1")
+        self.assertEqual(record["queries"], 1)
+
+class ProfilingMiddlewareTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_profiling_trusted_header_with_rotation(self):
+        with override_settings(
+            PROFILING_ENABLED     = True,
+            PROFILING_SAMPLE_RATE = 0,
+            PROFILING_TOKEN       = "trusted",
+            PROFILING_DIR         = self.directory.name,
+            PROFILING_DUMP_EVERY  = 1,
+            PROFILING_KEEP        = 2
+        ):
+            client = Client()
+
+            for _ in range(3):
+                client.get('/boards/1', HTTP_X_PROFILE = "trusted")
+
+            client.get('/boards/1')
+
+        dumps = os.listdir(self.directory.name)
+
+        self.assertEqual(len(dumps), 2)
+        self.assertTrue(all(name.startswith("boards_int_board_id.") for name in dumps))
+        self.assertGreater(pstats.Stats(os.path.join(self.directory.name, dumps[0])).total_calls, 0)
+
+    def test_profiling_sample_rate(self):
+        with override_settings(
+            PROFILING_ENABLED     = True,
+            PROFILING_SAMPLE_RATE = 2,
+            PROFILING_DIR         = self.directory.name,
+            PROFILING_DUMP_EVERY  = 2
+        ):
+            client = Client()
+
+            for _ in range(4):
+                client.get('/boards')
+
+        self.assertEqual(len(os.listdir(self.directory.name)), 1)
+
+class MetricsLogTest(TestCase):
+    def test_metrics_logged_every_interval(self):
+        metrics = MetricsLogger(interval = 60)
+
+        with self.assertNoLogs("wanted.metrics"):
+            self.assertFalse(metrics.maybe_log())
+
+        metrics.last -= 60
+
+        with self.assertLogs("wanted.metrics", level = "INFO") as logs:
+            self.assertTrue(metrics.maybe_log())
+
+        record = json.loads(logs.records[0].getMessage())
+
+        self.assertEqual(record["event"], "metrics")
+        self.assertEqual(record["pid"], os.getpid())
+        self.assertEqual(set(record["password_pool"]), { "workers", "in_flight", "queue_depth", "completed", "rejected", "latency_p50", "latency_p95", "latency_p99" })
+        self.assertEqual(record["principal_cache"], user_cache.stats())
+        self.assertEqual(set(record["board_list_cache"]), { "hits", "misses", "hit_ratio" })
+
+    @override_settings(METRICS_LOG_INTERVAL = 0.001)
+    def test_metrics_logged_from_requests(self):
+        client = Client()
+
+        with self.assertLogs("wanted.metrics", level = "INFO"):
+            client.get('/boards')
+            time.sleep(0.01)
+            client.get('/boards')
+
+class SqlitePragmaTest(TestCase):
+    def test_connection_pragmas_applied(self):
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA synchronous")
+            self.assertEqual(cursor.fetchone()[0], 1)
+
+            cursor.execute("PRAGMA busy_timeout")
+            self.assertEqual(cursor.fetchone()[0], 5000)
+
+class FileDatabaseTestCase(SimpleTestCase):
+    """
+    # 테스트 DB(shared-cache 메모리 DB)로는 연결 간 lock 대기나 별도 replica 파일을 재현할 수 없으므로
+    # 임시 파일 DB를 migrate하고, 스레드마다 그 파일에 연결을 열어 확인
+    """
+
+    REPLICA = False
+
+    def setUp(self):
+        self.directory    = tempfile.TemporaryDirectory()
+        self.database     = connections[DEFAULT_DB_ALIAS]
+        self.path         = os.path.join(self.directory.name, "primary.sqlite3")
+        self.replica_path = os.path.join(self.directory.name, "replica.sqlite3") if self.REPLICA else self.path
+        self.user         = self.in_thread(self.migrate)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def connected(self, func):
+        #스레드마다 settings의 backend, OPTIONS 그대로 파일 DB에 연결
+        backend = type(self.database)
+
+        connections[DEFAULT_DB_ALIAS] = backend(dict(self.database.settings_dict, NAME = self.path), DEFAULT_DB_ALIAS)
+        connections["replica"]        = backend(dict(self.database.settings_dict, NAME = self.replica_path), "replica")
+
+        try:
+            return func()
+
+        finally:
+            connections[DEFAULT_DB_ALIAS].close()
+            connections["replica"].close()
+
+    def in_thread(self, func):
+        #새 스레드마다 pinned_to_primary 등 context가 비어 있는 상태로 실행
+        with ThreadPoolExecutor(max_workers = 1) as executor:
+            return executor.submit(self.connected, func).result()
+
+    def migrate(self):
+        call_command("migrate", verbosity = 0)
+
+        return User.objects.create(nickname = "orange", password = "pass1234!@")
+
+class ConcurrentWriteTest(FileDatabaseTestCase):
+    WRITERS = 8
+    BOARDS  = 10
+
+    def write(self):
+        for i in range(self.BOARDS):
+            CreateBoard(self.user, f"{i}번째 게시글", "내용을 입력해 주세요.")
+
+    def test_concurrent_create_board(self):
+        with ThreadPoolExecutor(max_workers = self.WRITERS) as executor:
+            for future in [executor.submit(self.connected, self.write) for _ in range(self.WRITERS)]:
+                future.result()
+
+        total = self.WRITERS * self.BOARDS
+
+        self.assertEqual(self.in_thread(lambda : Board.objects.using(DEFAULT_DB_ALIAS).count()), total)
+        self.assertEqual(self.in_thread(GetBoardCount), total)
+
+class SqliteReplicaTest(FileDatabaseTestCase):
+    REPLICA = True
+
+    def sync(self):
+        call_command("sync_replica", stdout = StringIO())
+
+    def create(self):
+        CreateBoard(self.user, "게시판 등록", "내용을 입력해 주세요.")
+
+        return Board.objects.using(DEFAULT_DB_ALIAS).latest("id").id
+
+    def detail_status(self, board_id, pinned = False):
+        client = Client()
+
+        if pinned:
+            client.cookies["pin_primary"] = "1"
+
+        return client.get(f'/boards/{board_id}').status_code
+
+    def test_replica_reads_after_sync(self):
+        self.assertEqual(self.in_thread(ReplicaAlias), "replica")
+
+        self.in_thread(self.sync)
+        board_id = self.in_thread(self.create)
+
+        #복사 전에는 replica에 없으므로 고정되지 않은 읽기는 찾지 못하고, 고정된 읽기는 primary에서 찾음
+        self.assertEqual(self.in_thread(Board.objects.count), 0)
+        self.assertEqual(self.in_thread(lambda : self.detail_status(board_id)), 400)
+        self.assertEqual(self.in_thread(lambda : self.detail_status(board_id, pinned = True)), 200)
+
+        self.in_thread(self.sync)
+
+        self.assertEqual(self.in_thread(Board.objects.count), 1)
+        self.assertEqual(self.in_thread(lambda : self.detail_status(board_id)), 200)
+
+    def test_sync_replica_requires_separate_database(self):
+        self.replica_path = self.path
+
+        with self.assertRaises(CommandError):
+            self.in_thread(self.sync)
+
+class PrimaryReplicaRouterTest(TestCase):
+    def setUp(self):
+        self.router = PrimaryReplicaRouter()
+        self.token  = pinned_to_primary.set(False)
+
+    def tearDown(self):
+        pinned_to_primary.reset(self.token)
+
+    def test_router_replica_same_as_primary(self):
+        self.assertIsNone(ReplicaAlias())
+        self.assertEqual(self.router.db_for_read(Board), "default")
+
+    @patch("core.router.ReplicaAlias", return_value = "replica")
+    def test_router_board_reads_to_replica(self, replica_alias):
+        self.assertEqual(self.router.db_for_read(Board), "replica")
+        self.assertEqual(self.router.db_for_read(User), "default")
+
+    @patch("core.router.ReplicaAlias", return_value = "replica")
+    def test_router_reads_pinned_after_write(self, replica_alias):
+        self.assertEqual(self.router.db_for_write(Board), "default")
+        self.assertEqual(self.router.db_for_read(Board), "default")
+
+    def test_router_allow_migrate(self):
+        self.assertTrue(self.router.allow_migrate("default", "boards"))
+        self.assertFalse(self.router.allow_migrate("replica", "boards"))
+
+class ReplicaPinningMiddlewareTest(TestCase):
+    def setUp(self):
+        user = User.objects.create(
+            nickname = "orange",
+            password = "pass1234!@"
+        )
+        self.token = jwt.encode({ "id" : user.id }, SECRET_KEY, algorithm = "HS256")
+
+    def tearDown(self):
+        User.objects.all().delete()
+        Board.objects.all().delete()
+
+    def test_pin_cookie_set_after_write(self):
+        client     = Client()
+        board_data = {
+            "title"   : "게시판 등록",
+            "content" : "내용을 입력해 주세요."
+        }
+        response = client.post('/boards/write', json.dumps(board_data), content_type = "application/json", HTTP_Authorization = self.token)
+
+        self.assertEqual(response.cookies["pin_primary"]["max-age"], 5)
+
+        response = client.get('/boards')
+        self.assertNotIn("pin_primary", response.cookies)
+
+    def test_pin_cookie_not_set_on_failed_write(self):
+        client   = Client()
+        response = client.post('/boards/write', "{}", content_type = "application/json", HTTP_Authorization = self.token)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertNotIn("pin_primary", response.cookies)
+
+    def test_sync_and_async_capable(self):
+        async def get_response(request):
+            return None
+
+        self.assertTrue(ReplicaPinningMiddleware.sync_capable)
+        self.assertTrue(ReplicaPinningMiddleware.async_capable)
+        self.assertTrue(asyncio.iscoroutinefunction(ReplicaPinningMiddleware(get_response)))
+        self.assertFalse(asyncio.iscoroutinefunction(ReplicaPinningMiddleware(lambda request : None)))
+
+    async def test_pin_cookie_set_after_async_write(self):
+        client     = AsyncClient()
+        board_data = {
+            "title"   : "게시판 등록",
+            "content" : "내용을 입력해 주세요."
+        }
+        response = await client.post('/async/boards/write', json.dumps(board_data), content_type = "application/json", authorization = self.token)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.cookies["pin_primary"]["max-age"], 5)
+
+@override_settings(BCRYPT_ROUNDS = 4)
+class SeedDataCommandTest(TestCase):
+    def seed(self, **options):
+        call_command("seed_data", batch_size = 7, stdout = StringIO(), **options)
+
+    def test_seed_data(self):
+        self.seed(users = 5, boards = 30, seed = 1, prefix = "first")
+
+        self.assertEqual(User.objects.filter(nickname__startswith = "first").count(), 5)
+        self.assertEqual(Board.objects.count(), 30)
+        self.assertEqual(len(set(User.objects.values_list("password", flat = True))), 1)
+        self.assertGreater(len(set(Board.objects.values_list("updated_at", flat = True))), 1)
+        self.assertTrue(Board._meta.get_field("updated_at").auto_now)
+
+        for board in Board.objects.all():
+            self.assertEqual(board.writer_nickname, board.writer.nickname)
+            self.assertEqual(board.content_length, len(board.content))
+            self.assertLessEqual(board.created_at, board.updated_at)
+
+    def test_seed_data_deterministic(self):
+        self.seed(users = 5, boards = 20, seed = 3, prefix = "first")
+        self.seed(users = 5, boards = 20, seed = 3, prefix = "second")
+
+        first  = list(Board.objects.filter(writer_nickname__startswith = "first").order_by("id").values_list("title", "content"))
+        second = list(Board.objects.filter(writer_nickname__startswith = "second").order_by("id").values_list("title", "content"))
+
+        self.assertEqual(first, second)
+
+    def test_seed_data_existing_users(self):
+        self.seed(users = 3, boards = 0, prefix = "first")
+        self.seed(users = 0, boards = 10)
+
+        self.assertEqual(Board.objects.count(), 10)
+        self.assertEqual(set(Board.objects.values_list("writer_nickname", flat = True)) - {"first0", "first1", "first2"}, set())
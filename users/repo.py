@@ -1,4 +1,25 @@
+from django.db import IntegrityError, transaction
+
 from users.models import User
 
-def IsUserExist(nickname):
-    return User.objects.filter(nickname = nickname).exists()
+class DuplicatedNickname(Exception):
+    pass
+
+def CreateUser(nickname, password):
+    #존재 여부를 먼저 조회하지 않고 unique 제약 위반으로 중복을 판단 (INSERT 한 번, 경쟁 상태 없음)
+    try:
+        with transaction.atomic():
+            return User.objects.create(
+                nickname = nickname,
+                password = password
+            )
+
+    except IntegrityError:
+        raise DuplicatedNickname
+
+def GetUserOrNone(nickname):
+    try:
+        return User.objects.get(nickname = nickname)
+
+    except User.DoesNotExist:
+        return None
@@ -1,8 +1,14 @@
-import jwt, json, bcrypt
+import jwt, json, bcrypt, threading
 
-from django.test import TestCase, Client
+from unittest.mock import patch
 
+from django.db         import connection
+from django.test       import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from core.password import PasswordPool, PasswordPoolSaturated, password_pool
 from users.models  import User
+from users.repo    import CreateUser, GetUserOrNone, DuplicatedNickname
 from my_settings   import SECRET_KEY
 
 class SignUpViewTest(TestCase):
@@ -130,4 +136,87 @@ class SignInViewTest(TestCase):
         }
         response = client.post('/user/sign-in', json.dumps(sign_in), content_type = 'application/json')
         self.assertEqual(response.json(), { "MESSAGE" : "KEY ERROR" })
-        self.assertEqual(response.status_code, 400)
\ No newline at end of file
+        self.assertEqual(response.status_code, 400)
+
+    @override_settings(BCRYPT_ROUNDS = 4)
+    def test_SignInView_post_rehash_to_configured_cost(self):
+        client = Client()
+        sign_in = {
+            "nickname" : "orange",
+            "password" : "pass1234!@"
+        }
+        response = client.post('/user/sign-in', json.dumps(sign_in), content_type = 'application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(User.objects.get(nickname = "orange").password.startswith("$2b$04$"))
+
+    def test_SignInView_post_server_busy(self):
+        client = Client()
+        sign_in = {
+            "nickname" : "orange",
+            "password" : "pass1234!@"
+        }
+        with patch.object(password_pool, "run", side_effect = PasswordPoolSaturated):
+            response = client.post('/user/sign-in', json.dumps(sign_in), content_type = 'application/json')
+
+        self.assertEqual(response.json(), { "MESSAGE" : "SERVER BUSY" })
+        self.assertEqual(response.status_code, 503)
+
+class PasswordPoolTest(TestCase):
+    def test_PasswordPool_rejects_when_saturated(self):
+        pool    = PasswordPool(workers = 1, max_queue = 0)
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking():
+            started.set()
+            release.wait()
+
+        thread = threading.Thread(target = pool.run, args = (blocking,))
+        thread.start()
+        started.wait()
+
+        with self.assertRaises(PasswordPoolSaturated):
+            pool.run(bcrypt.gensalt)
+
+        release.set()
+        thread.join()
+
+        self.assertEqual(pool.stats()["rejected"], 1)
+        self.assertEqual(pool.stats()["completed"], 1)
+        self.assertEqual(pool.stats()["in_flight"], 0)
+
+class UserRepositoryTest(TestCase):
+    def setUp(self):
+        User.objects.create(
+            nickname = "orange",
+            password = "pass1234!@"
+        )
+
+    def tearDown(self):
+        User.objects.all().delete()
+
+    def users_queries(self, queries):
+        #savepoint 등 transaction 제어 구문을 제외한 users 테이블 조회/변경 쿼리
+        return [query for query in queries if '"users"' in query["sql"]]
+
+    def test_CreateUser_single_insert(self):
+        with CaptureQueriesContext(connection) as queries:
+            user = CreateUser("star123", "hashed")
+
+        self.assertEqual(user.nickname, "star123")
+        self.assertEqual(len(self.users_queries(queries)), 1)
+
+    def test_CreateUser_duplicated_nickname(self):
+        with CaptureQueriesContext(connection) as queries:
+            with self.assertRaises(DuplicatedNickname):
+                CreateUser("orange", "hashed")
+
+        self.assertEqual(len(self.users_queries(queries)), 1)
+        self.assertEqual(User.objects.filter(nickname = "orange").count(), 1)
+
+    def test_GetUserOrNone(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(GetUserOrNone("orange").nickname, "orange")
+
+        with self.assertNumQueries(1):
+            self.assertIsNone(GetUserOrNone("strawberry"))
@@ -1,7 +1,9 @@
 from django.urls import path
 from users.views import SignInView, SignUpView
+from boards.views import UserBoardListView
 
 urlpatterns = [
     path('/sign-up', SignUpView.as_view()),
     path('/sign-in', SignInView.as_view()),
+    path('/<int:user_id>/boards', UserBoardListView.as_view()),
 ]
\ No newline at end of file
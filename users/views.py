@@ -1,18 +1,25 @@
-import json, bcrypt, jwt
+import json
 
 from rest_framework.views import APIView
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
-from django.views           import View
-from django.http            import JsonResponse, response
-
-from my_settings    import SECRET_KEY
-from users.models   import User
+from core.auth      import CreateAccessToken
+from core.response  import JsonResponse
+from core.password  import HashPassword, CheckPassword, NeedsRehash, PasswordPoolSaturated
 from core.validator import VerifyNickname, VerifyPassword
-from .repo          import IsUserExist
+from .repo          import CreateUser, GetUserOrNone, DuplicatedNickname
 from .serializers   import UserSerializer
 
+def RehashPassword(user, password):
+    #설정된 cost와 다른 해시는 로그인 성공 시 다시 해시 (pool이 바쁘면 다음 로그인으로 미룸)
+    try:
+        user.password = HashPassword(password)
+        user.save(update_fields = ["password", "updated_at"])
+
+    except PasswordPoolSaturated:
+        pass
+
 class SignUpView(APIView):
 
     serializer_class = UserSerializer
@@ -26,28 +33,27 @@ class SignUpView(APIView):
             if type(nickname) != str or type(password) != str:
                 return JsonResponse({ "MESSAGE" : f"INPUT MUST BE STRING, INPUT TYPE IS {type(nickname)}" }, status = 400)
             
-            if IsUserExist(nickname):
-                return JsonResponse({ "MESSAGE" : "DUPLICATED NICKNAME" }, status = 409)
-
             if not VerifyNickname(nickname):
                 return JsonResponse({ "MESSAGE" : "NICKNAME ONLY CONTAIN 'alphabet' and 'number', ALSO LENGTH BETWEEN 3 ~ 15" }, status = 400)
             
             if not VerifyPassword(password):
                 return JsonResponse({ "MESSAGE" : "PASSWORD MUST CONTAIN 'alphabet', 'number', 'special character', ALSO LENGTH BETWEEN 8 ~ 20" }, status = 400)
 
-            hashed_pw  = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
-            decoded_pw = hashed_pw.decode("utf-8")
+            decoded_pw = HashPassword(password)
 
-            User.objects.create(
-                nickname = nickname,
-                password = decoded_pw
-            )
+            CreateUser(nickname, decoded_pw)
 
             return JsonResponse({ "MESSAGE" : "CREATED" }, status = 201)
 
+        except DuplicatedNickname:
+            return JsonResponse({ "MESSAGE" : "DUPLICATED NICKNAME" }, status = 409)
+
         except KeyError:
             return JsonResponse({ "MESSAGE" : "KEY ERROR" }, status = 400)
 
+        except PasswordPoolSaturated:
+            return JsonResponse({ "MESSAGE" : "SERVER BUSY" }, status = 503)
+
 class SignInView(APIView):
 
     serializer_class = UserSerializer
@@ -58,19 +64,25 @@ class SignInView(APIView):
             
             nickname, password = data["nickname"], data["password"]
 
-            if not IsUserExist(nickname):
-                return JsonResponse({ "MESSAGE" : "LOGIN ERROR"}, status = 401)
+            user = GetUserOrNone(nickname)
 
-            user = User.objects.get(nickname = nickname)
+            if user is None:
+                return JsonResponse({ "MESSAGE" : "LOGIN ERROR"}, status = 401)
 
-            if not bcrypt.checkpw(password.encode("utf-8"), user.password.encode("utf-8")):
+            if not CheckPassword(password, user.password):
                 return JsonResponse({ "MESSAGE" : "LOGIN ERROR"}, status = 401)
+
+            if NeedsRehash(user.password):
+                RehashPassword(user, password)
             
-            token = jwt.encode({"id" : user.id}, SECRET_KEY, algorithm = "HS256")
+            token = CreateAccessToken(user)
 
             return JsonResponse({ 
                 "MESSAGE" : "SUCCESS",
                 "TOKEN"   : token }, status = 200)
 
         except KeyError:
-            return JsonResponse({ "MESSAGE" : "KEY ERROR" }, status = 400)
\ No newline at end of file
+            return JsonResponse({ "MESSAGE" : "KEY ERROR" }, status = 400)
+
+        except PasswordPoolSaturated:
+            return JsonResponse({ "MESSAGE" : "SERVER BUSY" }, status = 503)
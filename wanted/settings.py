@@ -47,6 +47,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.ProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -55,6 +56,9 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
+    'core.middleware.ReplicaPinningMiddleware',
+    'core.middleware.MetricsLogMiddleware',
+    'core.middleware.RequestTimingMiddleware',
 ]
 
 ROOT_URLCONF = 'wanted.urls'
@@ -81,10 +85,54 @@ WSGI_APPLICATION = 'wanted.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/3.2/ref/settings/#databases
 
+#core.backends.sqlite3: 쓰기 transaction을 BEGIN IMMEDIATE로 시작해 FTS5 trigger가 있는 동시 쓰기가 lock 대기 없이 실패하지 않도록 함
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
+        'ENGINE': 'core.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': 60,
+        'OPTIONS': {
+            'transaction_mode': 'IMMEDIATE',
+        },
+    },
+    #게시글 조회용 replica, primary와 같은 파일을 가리키면 router가 primary만 사용
+    #로컬에서 replica 분리를 확인하려면 NAME을 BASE_DIR / 'db.replica.sqlite3' 등 별도 파일로 변경하고
+    #manage.py sync_replica로 primary를 복사 (replica는 migrate하지 않음, --interval로 주기 복사)
+    'replica': {
+        'ENGINE': 'core.backends.sqlite3',
+        'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': 60,
+        'TEST': {
+            'MIRROR': 'default',
+        },
+    },
+}
+
+DATABASE_ROUTERS       = ['core.router.PrimaryReplicaRouter']
+DATABASE_REPLICA_ALIAS = 'replica'
+
+#쓰기 이후 REPLICA_PIN_SECONDS 동안 같은 클라이언트의 읽기를 primary로 고정 (read-your-writes)
+REPLICA_PIN_COOKIE  = 'pin_primary'
+REPLICA_PIN_SECONDS = 5
+
+#새 SQLite 연결마다 적용할 PRAGMA (core.db)
+SQLITE_PRAGMAS = {
+    'journal_mode' : 'WAL',
+    'synchronous'  : 'NORMAL',
+    'mmap_size'    : 256 * 1024 * 1024,
+    'cache_size'   : -64 * 1024,
+    'busy_timeout' : 5000,
+    'temp_store'   : 'MEMORY',
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/3.2/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'wanted',
     }
 }
 
@@ -162,4 +210,64 @@ CORS_ALLOW_HEADERS = (
 
 SWAGGER_SETTINGS = {
     'JSON_EDITOR': True,
-}
\ No newline at end of file
+}
+
+#AUTHENTICATION MODE ("database" : 요청마다 유저 조회, "claims" : 토큰 claim만으로 인증)
+AUTH_MODE           = "database"
+AUTH_TOKEN_LIFETIME = 60 * 60
+
+#AUTHENTICATION USER CACHE
+AUTH_USER_CACHE_SIZE = 1024
+AUTH_USER_CACHE_TTL  = 60
+
+#BOARD LIST RESPONSE CACHE
+BOARD_LIST_CACHE_ALIAS   = "default"
+BOARD_LIST_CACHE_TIMEOUT = 60
+
+#BOARD BULK CREATE
+BOARD_BULK_MAX_ITEMS  = 10000
+BOARD_BULK_BATCH_SIZE = 500
+
+#PASSWORD HASHING (bcrypt cost, 전용 thread pool 크기 및 대기열 제한)
+BCRYPT_ROUNDS           = 12
+PASSWORD_POOL_WORKERS   = 4
+PASSWORD_POOL_MAX_QUEUE = 32
+
+#BOARD BATCH DETAIL (한 번에 조회할 수 있는 게시글 수)
+BOARD_BATCH_MAX_IDS = 100
+
+#BOARD EXPORT
+BOARD_EXPORT_BATCH_SIZE = 1000
+
+#BOARD PREVIEW (작성 시 저장하는 content 미리보기 길이, 200 이하)
+BOARD_PREVIEW_LENGTH = 100
+
+#JSON RESPONSE ("json" : 표준 json, 기존 JsonResponse와 byte 단위로 동일,
+#               "orjson" : orjson이 설치되어 있으면 사용, 구분자 공백이 없고 한글을 \uXXXX 대신 UTF-8로 쓰므로 클라이언트 확인 후 사용)
+JSON_RESPONSE_BACKEND = "json"
+
+#REQUEST TIMING (Server-Timing 헤더 및 느린 요청 로그, 끄면 middleware가 로드되지 않음)
+REQUEST_TIMING_ENABLED = False
+REQUEST_TIMING_SLOW_MS = 500
+
+#METRICS (프로세스별 counter를 METRICS_LOG_INTERVAL초마다 wanted.metrics logger로 기록, 0이면 끔)
+METRICS_LOG_INTERVAL = 60
+
+LOGGING = {
+    'version'                  : 1,
+    'disable_existing_loggers' : False,
+    'handlers'                 : {
+        'console' : { 'class' : 'logging.StreamHandler' },
+    },
+    'loggers'                  : {
+        'wanted.metrics' : { 'handlers' : ['console'], 'level' : 'INFO' },
+    },
+}
+
+#PROFILING (cProfile 샘플링, X-Profile 헤더에 PROFILING_TOKEN을 넣으면 해당 요청은 항상 측정)
+PROFILING_ENABLED     = False
+PROFILING_SAMPLE_RATE = 100
+PROFILING_TOKEN       = None
+PROFILING_DIR         = BASE_DIR / 'profiles'
+PROFILING_DUMP_EVERY  = 10
+PROFILING_KEEP        = 5
\ No newline at end of file
@@ -26,6 +26,7 @@ schema_view_v1 = get_schema_view(
 urlpatterns = [
     path('user', include('users.urls')),
     path('boards', include('boards.urls')),
+    path('async/boards', include('boards.async_urls')),
     url(r'^swagger(?P<format>\.json|\.yaml)$', schema_view_v1.without_ui(cache_timeout=0), name='schema-json'),
     url(r'^swagger/$', schema_view_v1.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
     url(r'^redoc/$', schema_view_v1.with_ui('redoc', cache_timeout=0), name='schema-redoc'),